@@ -1,5 +1,4 @@
 import os
-from setuptools import find_packages
 from setuptools import setup
 
 folder = os.path.dirname(__file__)
@@ -34,7 +33,13 @@ setup(
         ]        
     },
     package_dir={"": "src"},
-    packages=find_packages("src"),    
+    packages=[
+        "projects_tools",
+        "projects_tools.cli",
+        "projects_tools.llm_integration",
+        "projects_tools.templating",
+        "projects_tools.utils",
+    ],
     package_data={
         "projects_tools": [            
             "templates/*.jinja2"
@@ -52,6 +57,11 @@ setup(
         'httpx>=0.24.0',
         'aiofiles>=0.8.0',
     ],
+    extras_require={
+        'fast': [
+            'orjson>=3.0.0',
+        ],
+    },
     classifiers=[        
         "Topic :: Scientific/Engineering :: Artificial Intelligence",
         "Programming Language :: Python :: 3.9",
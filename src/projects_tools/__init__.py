@@ -8,13 +8,56 @@ This package provides tools for creating and managing projects, including:
 - Configuration management
 """
 
-# Initialize logging
-from .utils.logging import configure_logging
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
 from .version import __version__
 
-configure_logging()
+if TYPE_CHECKING:
+    from .cli.commands import cli, main
+
+# CLI entry points are resolved on first attribute access so that
+# ``import projects_tools`` does not pull in click, rich and the CLI stack.
+_lazy_imports: Dict[str, str] = {
+    "cli": ".cli.commands",
+    "main": ".cli.commands",
+}
+
+_logging_initialized = False
+
+
+def _initialize_logging() -> None:
+    """Configure logging once, the first time the CLI is requested."""
+    global _logging_initialized
+    if _logging_initialized:
+        return
+
+    from .utils.logging import configure_logging
+
+    configure_logging()
+    _logging_initialized = True
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve lazily exported attributes on first access.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        The resolved attribute.
+
+    Raises:
+        AttributeError: If the attribute is not a lazy export.
+    """
+    if name in _lazy_imports:
+        _initialize_logging()
+        module = importlib.import_module(_lazy_imports[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Don't import CLI commands here to avoid circular imports
-# These will be imported when needed
 
-__all__ = ["__version__"]
+__all__ = ["__version__", "cli", "main"]
@@ -0,0 +1,69 @@
+"""
+Codebase analysis command.
+
+This module provides the ``analyze-codebase`` command.
+"""
+
+import click
+
+from ..utils.errors import ValidationError, format_error
+from .validators import (
+    validate_llm_provider,
+    validate_project_path,
+)
+
+
+@click.command()
+@click.argument("project_path", default=".")
+@click.option("--include-patterns", "-i", multiple=True, help="Glob patterns to include")
+@click.option("--exclude-patterns", "-e", multiple=True, help="Glob patterns to exclude")
+@click.option("--output-file", "-o", help="Path to save analysis results")
+@click.option(
+    "--llm-provider",
+    type=click.Choice(["openai", "anthropic"], case_sensitive=False),
+    default=None,
+    help="LLM provider to use (default: from config)",
+)
+def analyze_codebase(project_path, include_patterns, exclude_patterns, output_file, llm_provider):
+    """Analyze a codebase and generate insights."""
+    from ..llm.analyzer import CodebaseAnalyzer
+    from ..utils.config import config
+    from .formatters import print_analysis_results, print_error, print_info, print_success
+
+    try:
+        # Validate inputs
+        project_path = validate_project_path(project_path)
+
+        if llm_provider is None:
+            llm_provider = config.get_cached("llm.default_provider", "openai")
+        else:
+            llm_provider = validate_llm_provider(llm_provider)
+
+        print_info(f"Analyzing codebase at {project_path}")
+
+        # Create analyzer
+        analyzer = CodebaseAnalyzer(project_path, llm_provider)
+
+        # Convert include/exclude patterns to lists
+        include_patterns_list = list(include_patterns) if include_patterns else None
+        exclude_patterns_list = list(exclude_patterns) if exclude_patterns else None
+
+        # Analyze the codebase
+        analysis_results = analyzer.analyze_codebase(include_patterns_list, exclude_patterns_list)
+
+        # Print analysis results
+        print_analysis_results(analysis_results)
+
+        # Visualize the dependency graph
+        print_info("Dependency Graph:")
+        analyzer.visualize_dependency_graph()
+
+        # Export analysis results if requested
+        if output_file:
+            if analyzer.export_analysis(output_file):
+                print_success(f"Analysis results exported to {output_file}")
+
+    except ValidationError as e:
+        print_error(format_error(e))
+    except Exception as e:
+        print_error(f"Error analyzing codebase: {str(e)}")
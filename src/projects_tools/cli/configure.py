@@ -0,0 +1,73 @@
+"""
+Configuration command.
+
+This module provides the ``configure`` command.
+"""
+
+import click
+
+# Literal values accepted as booleans by ``configure --set``
+_TRUE = frozenset({"true", "yes", "1"})
+_FALSE = frozenset({"false", "no", "0"})
+
+
+@click.command()
+@click.option("--config-file", "-c", help="Path to configuration file")
+@click.option("--show", "-s", is_flag=True, help="Show current configuration")
+@click.option(
+    "--set", "-S", "set_values", nargs=2, multiple=True, help="Set configuration value (key value)"
+)
+@click.option("--save", is_flag=True, help="Save configuration to file")
+def configure(config_file, show, set_values, save):
+    """Configure projects_tools."""
+    from ..utils.config import config
+    from .formatters import print_error, print_info, print_success
+
+    try:
+        # Load configuration from file if specified
+        if config_file:
+            if config.load_from_file(config_file):
+                print_success(f"Loaded configuration from {config_file}")
+            else:
+                print_error(f"Failed to load configuration from {config_file}")
+
+        # Set configuration values
+        for key, value in set_values:
+            # Convert value to appropriate type
+            lowered = value.lower()
+            if lowered in _TRUE:
+                value = True
+            elif lowered in _FALSE:
+                value = False
+            else:
+                try:
+                    value = int(value)
+                except ValueError:
+                    try:
+                        value = float(value)
+                    except ValueError:
+                        pass
+
+            config.set(key, value)
+            print_success(f"Set {key} = {value}")
+
+        # Show configuration
+        if show:
+            print_info("Current configuration:")
+            for key, value in config.as_dict().items():
+                if isinstance(value, dict):
+                    print(f"{key}:")
+                    for subkey, subvalue in value.items():
+                        print(f"  {subkey}: {subvalue}")
+                else:
+                    print(f"{key}: {value}")
+
+        # Save configuration
+        if save:
+            if config.save_to_file():
+                print_success("Configuration saved")
+            else:
+                print_error("Failed to save configuration")
+
+    except Exception as e:
+        print_error(f"Error configuring projects_tools: {str(e)}")
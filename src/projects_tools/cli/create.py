@@ -0,0 +1,85 @@
+"""
+Project creation command.
+
+This module provides the ``create`` command.
+"""
+
+import click
+
+from ..utils.errors import ProjectCreationError, ValidationError, format_error
+from .validators import (
+    validate_frontend_type,
+    validate_project_name,
+)
+
+
+@click.command()
+@click.argument("project_name")
+@click.option("--backend", is_flag=True, help="Create Python backend project")
+@click.option("--frontend", is_flag=True, help="Create frontend project")
+@click.option(
+    "--frontend_type",
+    type=click.Choice(["vue", "reactjs"], case_sensitive=False),
+    default=None,
+    help="Frontend type: vue or reactjs (default: from config)",
+)
+@click.option("--enable_proxy", is_flag=True, help="Enable proxy server for frontend")
+@click.option("--llm-assisted", is_flag=True, help="Enable LLM-assisted code generation")
+def create(project_name, backend, frontend, frontend_type, enable_proxy, llm_assisted):
+    """Create a new project with specified components."""
+    from ..core.project import ProjectManager
+    from ..utils.config import config
+    from .formatters import create_progress, print_error, print_info, print_success, print_warning
+
+    try:
+        # Validate inputs
+        project_name = validate_project_name(project_name)
+
+        if frontend_type is None:
+            frontend_type = config.get_cached("project.default_frontend", "reactjs")
+        else:
+            frontend_type = validate_frontend_type(frontend_type)
+
+        if not backend and not frontend:
+            print_warning("Please specify at least one of --backend or --frontend")
+            return
+
+        print_info(f"Creating new project: {project_name}")
+
+        # Create project manager
+        project_manager = ProjectManager()
+
+        # Create project
+        with create_progress() as progress:
+            task_id = progress.add_task("Creating project...", total=None)
+
+            project = project_manager.create_project(
+                name=project_name,
+                backend=backend,
+                frontend=frontend,
+                frontend_type=frontend_type,
+                enable_proxy=enable_proxy,
+                llm_assisted=llm_assisted,
+                progress=progress,
+            )
+
+            progress.update(task_id, completed=True)
+
+        print_success(f"Successfully created project: {project_name}")
+
+        # Print project info
+        print_info(f"Project path: {project.path}")
+
+        if llm_assisted:
+            print_warning(
+                "To use LLM-assisted features, set your API keys as environment variables:\n\n"
+                "For OpenAI: export OPENAI_API_KEY=your_key_here\n"
+                "For Anthropic: export ANTHROPIC_API_KEY=your_key_here"
+            )
+
+    except ValidationError as e:
+        print_error(format_error(e))
+    except ProjectCreationError as e:
+        print_error(format_error(e))
+    except Exception as e:
+        print_error(f"Unexpected error: {str(e)}")
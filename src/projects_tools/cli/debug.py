@@ -0,0 +1,59 @@
+"""
+Component debugging command.
+
+This module provides the ``debug`` command.
+"""
+
+import click
+
+from ..utils.errors import ValidationError, format_error
+from .validators import (
+    validate_component_path,
+    validate_llm_provider,
+    validate_project_path,
+)
+
+
+@click.command()
+@click.argument("component_path")
+@click.argument("issue_description")
+@click.option("--project-path", default=".", help="Path to the project")
+@click.option(
+    "--llm-provider",
+    type=click.Choice(["openai", "anthropic"], case_sensitive=False),
+    default=None,
+    help="LLM provider to use (default: from config)",
+)
+def debug(component_path, issue_description, project_path, llm_provider):
+    """Debug a component based on issue description."""
+    from ..llm.generator import CodeGenerator
+    from ..utils.config import config
+    from .formatters import print_error, print_info, print_success
+
+    try:
+        # Validate inputs
+        project_path = validate_project_path(project_path)
+        component_path = validate_component_path(component_path, str(project_path))
+
+        if llm_provider is None:
+            llm_provider = config.get_cached("llm.default_provider", "openai")
+        else:
+            llm_provider = validate_llm_provider(llm_provider)
+
+        print_info(f"Project Genie: Debugging component")
+
+        # Create code generator
+        generator = CodeGenerator(project_path, llm_provider)
+
+        # Debug component
+        success = generator.debug_component(component_path, issue_description)
+
+        if success:
+            print_success(f"Successfully debugged component at {component_path}")
+        else:
+            print_error(f"Failed to debug component at {component_path}")
+
+    except ValidationError as e:
+        print_error(format_error(e))
+    except Exception as e:
+        print_error(f"Error debugging component: {str(e)}")
@@ -4,16 +4,43 @@ Output formatters for the CLI.
 This module provides formatters for CLI output using rich.
 """
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.tree import Tree
-from rich.syntax import Syntax
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from typing import List, Dict, Any, Optional, Union
+import functools
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple, Union
 
-# Initialize console
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress, ProgressColumn
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> "Console":
+    """
+    Get the shared console, creating it on first use.
+
+    Returns:
+        Console instance.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve the ``console`` attribute lazily.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        The shared console.
+
+    Raises:
+        AttributeError: If the attribute is not ``console``.
+    """
+    if name == "console":
+        return _console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def print_success(message: str) -> None:
@@ -23,7 +50,7 @@ def print_success(message: str) -> None:
     Args:
         message: Message to print.
     """
-    console.print(Panel(f"[bold green]{message}[/bold green]"))
+    _console().print(f"[bold green]✓ {message}[/bold green]")
 
 
 def print_error(message: str) -> None:
@@ -32,8 +59,13 @@ def print_error(message: str) -> None:
 
     Args:
         message: Message to print.
+
+    Errors keep the panel border so they stand out from the other,
+    plain-styled status messages.
     """
-    console.print(Panel(f"[bold red]{message}[/bold red]"))
+    from rich.panel import Panel
+
+    _console().print(Panel(f"[bold red]{message}[/bold red]"))
 
 
 def print_warning(message: str) -> None:
@@ -43,7 +75,7 @@ def print_warning(message: str) -> None:
     Args:
         message: Message to print.
     """
-    console.print(Panel(f"[bold yellow]{message}[/bold yellow]"))
+    _console().print(f"[bold yellow]{message}[/bold yellow]")
 
 
 def print_info(message: str) -> None:
@@ -53,7 +85,7 @@ def print_info(message: str) -> None:
     Args:
         message: Message to print.
     """
-    console.print(Panel(f"[bold blue]{message}[/bold blue]"))
+    _console().print(f"[bold blue]{message}[/bold blue]")
 
 
 def print_code(code: str, language: str = "python") -> None:
@@ -64,8 +96,10 @@ def print_code(code: str, language: str = "python") -> None:
         code: Code to print.
         language: Language for syntax highlighting.
     """
+    from rich.syntax import Syntax
+
     syntax = Syntax(code, language, theme="monokai", line_numbers=True)
-    console.print(syntax)
+    _console().print(syntax)
 
 
 def print_table(
@@ -83,6 +117,8 @@ def print_table(
         rows: Table rows.
         caption: Optional caption for the table.
     """
+    from rich.table import Table
+
     table = Table(title=title, caption=caption)
     
     for column in columns:
@@ -91,7 +127,7 @@ def print_table(
     for row in rows:
         table.add_row(*row)
     
-    console.print(table)
+    _console().print(table)
 
 
 def print_tree(
@@ -107,6 +143,8 @@ def print_tree(
         data: Tree data.
         guide_style: Style for the tree guides.
     """
+    from rich.tree import Tree
+
     tree = Tree(f"[bold]{title}[/bold]", guide_style=guide_style)
     
     def add_branch(branch, data):
@@ -126,10 +164,23 @@ def print_tree(
                     branch.add(f"{i}: {item}")
     
     add_branch(tree, data)
-    console.print(tree)
+    _console().print(tree)
+
+
+@functools.lru_cache(maxsize=1)
+def _progress_columns() -> Tuple["ProgressColumn", ...]:
+    """
+    Get the shared progress columns, creating them on first use.
+
+    Returns:
+        Columns used by every progress bar.
+    """
+    from rich.progress import SpinnerColumn, TextColumn
+
+    return (SpinnerColumn(), TextColumn("[progress.description]{task.description}"))
 
 
-def create_progress(description: str = "") -> Progress:
+def create_progress(description: str = "") -> "Progress":
     """
     Create a progress bar.
 
@@ -139,11 +190,9 @@ def create_progress(description: str = "") -> Progress:
     Returns:
         Progress instance.
     """
-    return Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    )
+    from rich.progress import Progress
+
+    return Progress(*_progress_columns(), console=_console())
 
 
 def print_components(components: List[Dict[str, Any]]) -> None:
@@ -153,6 +202,8 @@ def print_components(components: List[Dict[str, Any]]) -> None:
     Args:
         components: List of components.
     """
+    console = _console()
+
     if not components:
         console.print("[yellow]No components found.[/yellow]")
         return
@@ -174,6 +225,10 @@ def print_analysis_results(results: Dict[str, Any]) -> None:
     Args:
         results: Analysis results.
     """
+    from rich.panel import Panel
+
+    console = _console()
+
     if not results:
         console.print("[yellow]No analysis results found.[/yellow]")
         return
@@ -0,0 +1,54 @@
+"""
+Code generation command.
+
+This module provides the ``genie`` command.
+"""
+
+import click
+
+from ..utils.errors import ValidationError, format_error
+from .validators import (
+    validate_llm_provider,
+    validate_project_path,
+)
+
+
+@click.command()
+@click.argument("description")
+@click.option("--project-path", default=".", help="Path to the project")
+@click.option(
+    "--llm-provider",
+    type=click.Choice(["openai", "anthropic"], case_sensitive=False),
+    default=None,
+    help="LLM provider to use (default: from config)",
+)
+def genie(description, project_path, llm_provider):
+    """Generate code based on natural language description."""
+    from ..llm.generator import CodeGenerator
+    from ..utils.config import config
+    from .formatters import print_components, print_error, print_info
+
+    try:
+        # Validate inputs
+        project_path = validate_project_path(project_path)
+
+        if llm_provider is None:
+            llm_provider = config.get_cached("llm.default_provider", "openai")
+        else:
+            llm_provider = validate_llm_provider(llm_provider)
+
+        print_info(f"Project Genie: Generating from description")
+
+        # Create code generator
+        generator = CodeGenerator(project_path, llm_provider)
+
+        # Generate components
+        components = generator.generate_from_description(description)
+
+        # Print components
+        print_components(components)
+
+    except ValidationError as e:
+        print_error(format_error(e))
+    except Exception as e:
+        print_error(f"Error generating code: {str(e)}")
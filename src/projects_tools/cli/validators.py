@@ -6,6 +6,7 @@ This module provides validators for CLI input.
 
 import os
 import re
+import stat
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union, Callable, TypeVar
 
@@ -13,6 +14,18 @@ from ..utils.errors import ValidationError
 
 T = TypeVar("T")
 
+_PROJECT_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+
+# Accepted values and the corresponding error message suffixes
+_LLM_PROVIDERS = frozenset({"openai", "anthropic"})
+_LLM_PROVIDERS_MSG = "openai, anthropic"
+_FRONTEND_TYPES = frozenset({"vue", "reactjs"})
+_FRONTEND_TYPES_MSG = "vue, reactjs"
+_DB_TYPES = frozenset({"PostgreSQL", "MySQL", "SQLite"})
+_DB_TYPES_MSG = "PostgreSQL, MySQL, SQLite"
+_FEEDBACK_TYPES = frozenset({"error", "warning", "suggestion", "issue"})
+_FEEDBACK_TYPES_MSG = "error, warning, suggestion, issue"
+
 
 def validate_project_name(name: str) -> str:
     """
@@ -30,17 +43,19 @@ def validate_project_name(name: str) -> str:
     if not name:
         raise ValidationError("Project name cannot be empty")
     
-    if not re.match(r"^[a-zA-Z0-9_-]+$", name):
+    if not _PROJECT_NAME_RE.match(name):
         raise ValidationError(
             "Project name can only contain letters, numbers, underscores, and hyphens"
         )
     
-    if os.path.exists(name):
-        raise ValidationError(
-            f"Directory '{name}' already exists. Please choose a different name or delete the existing directory."
-        )
-    
-    return name
+    # lstat does not follow symlinks, so a dangling link also counts as taken
+    try:
+        os.lstat(name)
+    except FileNotFoundError:
+        return name
+    raise ValidationError(
+        f"Directory '{name}' already exists. Please choose a different name or delete the existing directory."
+    )
 
 
 def validate_project_path(path: str) -> Path:
@@ -58,9 +73,11 @@ def validate_project_path(path: str) -> Path:
     """
     try:
         path_obj = Path(path)
-        if not path_obj.exists():
+        try:
+            st = path_obj.stat()
+        except FileNotFoundError:
             raise ValidationError(f"Path '{path}' does not exist")
-        if not path_obj.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             raise ValidationError(f"Path '{path}' is not a directory")
         return path_obj
     except Exception as e:
@@ -89,9 +106,11 @@ def validate_component_path(path: str, project_path: Optional[str] = None) -> st
         else:
             full_path = path
         
-        if not os.path.exists(full_path):
+        try:
+            st = os.stat(full_path)
+        except FileNotFoundError:
             raise ValidationError(f"Component path '{path}' does not exist")
-        if not os.path.isfile(full_path):
+        if not stat.S_ISREG(st.st_mode):
             raise ValidationError(f"Component path '{path}' is not a file")
         return path
     except Exception as e:
@@ -113,12 +132,12 @@ def validate_llm_provider(provider: str) -> str:
     Raises:
         ValidationError: If the LLM provider is invalid.
     """
-    valid_providers = ["openai", "anthropic"]
-    if provider.lower() not in valid_providers:
+    value = provider.lower()
+    if value not in _LLM_PROVIDERS:
         raise ValidationError(
-            f"Invalid LLM provider: {provider}. Valid providers are: {', '.join(valid_providers)}"
+            f"Invalid LLM provider: {provider}. Valid providers are: {_LLM_PROVIDERS_MSG}"
         )
-    return provider.lower()
+    return value
 
 
 def validate_frontend_type(frontend_type: str) -> str:
@@ -134,12 +153,12 @@ def validate_frontend_type(frontend_type: str) -> str:
     Raises:
         ValidationError: If the frontend type is invalid.
     """
-    valid_types = ["vue", "reactjs"]
-    if frontend_type.lower() not in valid_types:
+    value = frontend_type.lower()
+    if value not in _FRONTEND_TYPES:
         raise ValidationError(
-            f"Invalid frontend type: {frontend_type}. Valid types are: {', '.join(valid_types)}"
+            f"Invalid frontend type: {frontend_type}. Valid types are: {_FRONTEND_TYPES_MSG}"
         )
-    return frontend_type.lower()
+    return value
 
 
 def validate_db_type(db_type: str) -> str:
@@ -155,10 +174,9 @@ def validate_db_type(db_type: str) -> str:
     Raises:
         ValidationError: If the database type is invalid.
     """
-    valid_types = ["PostgreSQL", "MySQL", "SQLite"]
-    if db_type not in valid_types:
+    if db_type not in _DB_TYPES:
         raise ValidationError(
-            f"Invalid database type: {db_type}. Valid types are: {', '.join(valid_types)}"
+            f"Invalid database type: {db_type}. Valid types are: {_DB_TYPES_MSG}"
         )
     return db_type
 
@@ -176,12 +194,12 @@ def validate_feedback_type(feedback_type: str) -> str:
     Raises:
         ValidationError: If the feedback type is invalid.
     """
-    valid_types = ["error", "warning", "suggestion", "issue"]
-    if feedback_type.lower() not in valid_types:
+    value = feedback_type.lower()
+    if value not in _FEEDBACK_TYPES:
         raise ValidationError(
-            f"Invalid feedback type: {feedback_type}. Valid types are: {', '.join(valid_types)}"
+            f"Invalid feedback type: {feedback_type}. Valid types are: {_FEEDBACK_TYPES_MSG}"
         )
-    return feedback_type.lower()
+    return value
 
 
 def validate_optional(
@@ -1,75 +1,254 @@
+import contextlib
+import functools
 import os
+import sys
 import click
-import subprocess
-import json
-from jinja2 import Environment, PackageLoader
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich import print as rprint
-
-# Import our templating system
-from .templating import (
-    TemplateManager, 
-    ComponentGenerator, 
-    TemplateContext,
-    TemplateRegistry,
-    PatternGenerator,
-    LayoutGenerator
-)
-from .templating.algorithms import generate_crud_operations, generate_form_validation
 
-# Initialize Jinja2 environment and rich console
-env = Environment(
-    loader=PackageLoader('projects_tools', 'templates')
-)
-console = Console()
+_TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), 'templates')
 
-# Initialize our templating system
-template_manager = TemplateManager(
-    package_name='projects_tools',
-    template_dir='templates'
+# Templates rendered by create
+_CREATE_TEMPLATES = (
+    'setup.py.jinja2',
+    'Makefile.jinja2',
+    'deploy.sh.jinja2',
+    'proxy.py.jinja2',
+    'README.md.jinja2',
 )
 
-# Initialize template registry
-template_registry = TemplateRegistry()
-pattern_registry_path = os.path.join(os.path.dirname(__file__), 'templates', 'patterns', 'pattern_registry.json')
-if os.path.exists(pattern_registry_path):
-    template_registry.load_from_file(pattern_registry_path)
-
-# Register algorithm generators
-template_registry.register_algorithm(
-    'generate_crud_operations',
-    generate_crud_operations,
-    ['model_name', 'fields'],
-    {'type': 'python', 'category': 'crud'}
-)
+# Built-in algorithms and the parameter that --model-name is passed as
+_ALGORITHM_NAME_PARAMS = {
+    'generate_crud_operations': 'model_name',
+    'generate_form_validation': 'form_name',
+}
+
+# Fixed file contents, encoded once
+_VERSION_PY = b'__version__ = "0.1.0"\n'
+_LLM_REQUIREMENTS = b"\n# LLM integration dependencies\nrequests>=2.28.0\n"
+_GITIGNORE = b"web/\nlogs/\n__pycache__/\ndist/\nbuild/\npasted/\n"
+
+
+# Heavy objects (rich console, Jinja environment, registries) are built on
+# first use so that importing this module, e.g. for --help, stays cheap.
+@functools.cache
+def _console():
+    """Return the shared rich console"""
+    from rich.console import Console
+    return Console()
+
+
+def _bytecode_cache():
+    """Return an on-disk Jinja bytecode cache, or None if it can't be created"""
+    import tempfile
+    from jinja2 import FileSystemBytecodeCache
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    # Fall back to the temp directory when the user cache is not writable
+    for cache_dir in (os.path.join(cache_home, 'projects_tools', 'jinja'),
+                      os.path.join(tempfile.gettempdir(), 'projects_tools_jinja_cache')):
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+        except OSError:
+            continue
+        if os.access(cache_dir, os.W_OK):
+            return FileSystemBytecodeCache(cache_dir)
+    return None
+
+
+def say(message, panel=False):
+    """Print a message with rich markup, or as plain text when not on a terminal"""
+    console = _console()
+    # Checked on every call, since stdout may be redirected after import
+    if console.is_terminal and not console.no_color:
+        if panel:
+            from rich.panel import Panel
+            message = Panel(message)
+        console.print(message)
+    else:
+        from rich.text import Text
+        sys.stdout.write(Text.from_markup(message).plain + '\n')
+
+
+def _escape(text):
+    """Escape user-supplied text so say() prints it verbatim rather than as markup"""
+    from rich.markup import escape
+    return escape(str(text))
+
+
+@functools.cache
+def _template_manager():
+    """Return the shared template manager"""
+    from .templating import TemplateManager
+    return TemplateManager(
+        package_name='projects_tools',
+        template_dir='templates',
+        bytecode_cache=_bytecode_cache()
+    )
+
+
+@functools.cache
+def _create_templates():
+    """Return the compiled templates used by create, keyed by name"""
+    template_manager = _template_manager()
+    return {name: template_manager.get_template(name) for name in _CREATE_TEMPLATES}
+
+
+@functools.cache
+def _template_registry():
+    """Return the template registry with patterns and algorithms loaded"""
+    from .templating import TemplateRegistry
+    from .templating.algorithms import generate_crud_operations, generate_form_validation
+
+    template_registry = TemplateRegistry()
+    try:
+        with open(os.path.join(_TEMPLATES_DIR, 'patterns', 'pattern_registry.json'), 'rb') as f:
+            template_registry.load_from_stream(f)
+    except FileNotFoundError:
+        pass
+
+    # Register algorithm generators
+    template_registry.register_algorithm(
+        'generate_crud_operations',
+        generate_crud_operations,
+        ['model_name', 'fields'],
+        {'type': 'python', 'category': 'crud'}
+    )
+
+    template_registry.register_algorithm(
+        'generate_form_validation',
+        generate_form_validation,
+        ['form_name', 'fields'],
+        {'type': 'javascript', 'category': 'validation'}
+    )
+    return template_registry
+
+
+@functools.cache
+def _pattern_generator():
+    """Return the shared pattern generator"""
+    from .templating import PatternGenerator
+    return PatternGenerator(_template_manager(), _template_registry())
+
+
+@functools.cache
+def _component_generator():
+    """Return the component generator with the component registry loaded"""
+    from .templating import ComponentGenerator
+
+    component_generator = ComponentGenerator(_template_manager())
+    try:
+        with open(os.path.join(_TEMPLATES_DIR, 'components', 'registry', 'component_registry.json'), 'rb') as f:
+            component_generator.load_component_registry_from_stream(f)
+    except FileNotFoundError:
+        pass
+    return component_generator
 
-template_registry.register_algorithm(
-    'generate_form_validation',
-    generate_form_validation,
-    ['form_name', 'fields'],
-    {'type': 'javascript', 'category': 'validation'}
-)
 
-# Initialize pattern generator
-pattern_generator = PatternGenerator(template_manager, template_registry)
+@functools.cache
+def _layout_generator():
+    """Return the layout generator with the layout registry loaded"""
+    from .templating import LayoutGenerator
+
+    layout_generator = LayoutGenerator(_template_manager(), _template_registry(), _pattern_generator())
+    try:
+        with open(os.path.join(_TEMPLATES_DIR, 'layouts', 'layout_registry.json'), 'rb') as f:
+            layout_generator.load_layouts_from_stream(f)
+    except FileNotFoundError:
+        pass
+    return layout_generator
+
+
+@functools.cache
+def _vue_creator():
+    """Return the Vue project creator"""
+    from .vue_tasks import create_vue_project
+    return create_vue_project
+
+
+@functools.cache
+def _react_creator():
+    """Return the React project creator"""
+    from .react_tasks import create_react_project
+    return create_react_project
+
+
+@functools.lru_cache(maxsize=8)
+def _genie(project_path, llm_provider, use_cache=False):
+    """Return the ProjectGenie for a project path and provider"""
+    from .llm_integration import ProjectGenie
+    return ProjectGenie(project_path, llm_provider, use_cache)
+
 
-# Initialize component generator
-component_generator = ComponentGenerator(template_manager)
+def _std_context(module_name, module_description, class_name, data_type=None, **values):
+    """Return the template context shared by the generate commands"""
+    from .templating import TemplateContext
 
-# Load component registry
-registry_path = os.path.join(os.path.dirname(__file__), 'templates', 'components', 'registry', 'component_registry.json')
-if os.path.exists(registry_path):
-    component_generator.load_component_registry(registry_path)
+    context = TemplateContext({
+        'module_name': module_name,
+        'module_description': module_description,
+        'class_name': class_name,
+        'class_name_variable': class_name.lower(),
+        **values
+    })
 
-# Initialize layout generator
-layout_generator = LayoutGenerator(template_manager, template_registry, pattern_generator)
+    # Add data_type if provided
+    if data_type:
+        context.set('data_type', data_type)
+    return context
+
+
+def _write_small(path, data, mode=None, append=False, durable=False):
+    """Write bytes to a file with raw os calls, bypassing buffered IO"""
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+    fd = os.open(path, flags, 0o666 if mode is None else mode)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    if mode is not None:
+        # The open mode is masked by the umask and ignored for existing files
+        os.chmod(path, mode)
+
+
+def _fsync_dir(path):
+    """Flush a directory's entries to disk where the platform allows it"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        # Directories cannot be opened on Windows
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_files(files, durable=False):
+    """Write (path, bytes[, mode]) tuples; parent directories must already exist
+
+    With durable, each file is fsync'ed before it is closed and the
+    directories holding them are fsync'ed afterwards.
+    """
+    write = functools.partial(_write_small, durable=durable)
+    if len(files) < 2:
+        for item in files:
+            write(*item)
+    else:
+        # The files are independent and os.write releases the GIL, so the
+        # writes can overlap; list() re-raises the first failure
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+            list(pool.map(lambda item: write(*item), files))
+
+    if durable:
+        for directory in {os.path.dirname(item[0]) or os.curdir for item in files}:
+            _fsync_dir(directory)
 
-# Load layout registry
-layout_registry_path = os.path.join(os.path.dirname(__file__), 'templates', 'layouts', 'layout_registry.json')
-if os.path.exists(layout_registry_path):
-    layout_generator.load_layouts_from_file(layout_registry_path)
 
 @click.group()
 def cli():
@@ -86,175 +265,155 @@ def cli():
               help='Frontend type: vue or reactjs (default: reactjs)')
 @click.option('--enable_proxy', is_flag=True, help='Enable proxy server for frontend')
 @click.option('--llm-assisted', is_flag=True, help='Enable LLM-assisted code generation')
-def create(project_name, backend, frontend, frontend_type, enable_proxy, llm_assisted):
+@click.option('--quiet', is_flag=True, help='Do not show the progress spinner')
+@click.option('--durable', is_flag=True, help='Flush the created files to disk before exiting')
+def create(project_name, backend, frontend, frontend_type, enable_proxy, llm_assisted, quiet, durable):
     """Create a new project with specified components"""
+    # Scaffolding has no durability requirement: if the process dies part
+    # way through, the user simply reruns create. Files are therefore only
+    # fsync'ed, along with their directories, when --durable is given.
     if not backend and not frontend:
-        console.print("[red]Please specify at least one of --backend or --frontend[/red]")
+        say("[red]Please specify at least one of --backend or --frontend[/red]")
         return
 
-    console.print(Panel(f"[bold blue]Creating new project: {project_name}[/bold blue]"))
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        # Create project directory
-        progress.add_task("Creating project directory...", total=None)
-        os.makedirs(project_name, exist_ok=True)
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from .templating import TemplateContext
+
+    console = _console()
+
+    say(f"[bold blue]Creating new project: {_escape(project_name)}[/bold blue]")
+
+    # A single progress task is advanced once per step: the directory tree,
+    # version.py, __init__.py and setup.py for the backend, the Makefile and
+    # frontend tooling for the frontend, then deploy.sh, .gitignore, proxy.py
+    # and README.md.
+    total_steps = 4 + 3 * backend + 2 * frontend + enable_proxy
+    progress = None
+    # The spinner is only drawn on a terminal
+    if not quiet and console.is_terminal:
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True
+        )
+        task_id = progress.add_task("Creating project files...", total=total_steps)
+
+    def advance(steps=1):
+        if progress is not None:
+            progress.advance(task_id, steps)
+
+    # Files are rendered into memory first and written together by
+    # _write_files, so rendering and disk I/O are not interleaved.
+    pending = []
+
+    # Path prefixes for the project root and the package directory, built
+    # once so each file path below is a single concatenation
+    root = project_name + os.sep
+    pkg_dir = root + "src" + os.sep + project_name + os.sep
+
+    with progress or contextlib.nullcontext():
+        # Create the project directory tree up front. The package
+        # directory is needed by the backend files and by proxy.py, and
+        # creating it also creates project_name and src.
+        if backend or enable_proxy:
+            os.makedirs(pkg_dir, exist_ok=True)
+        else:
+            os.makedirs(project_name, exist_ok=True)
         python_package_name = project_name.replace('-', '_')
+        advance()
+
+        # One context serves every template rendered below
+        base_ctx = TemplateContext({
+            'project_name': project_name,
+            'python_package_name': python_package_name
+        })
+        ctx = base_ctx.get_merged_context()
+        templates = _create_templates()
         
         if backend:
-            console.print("\n[bold cyan]Setting up Python backend:[/bold cyan]")
-            
-            # Create Python project structure
-            task_id = progress.add_task("Creating Python project structure...", total=None)
-            os.makedirs(os.path.join(project_name, "src"), exist_ok=True)
-            os.makedirs(os.path.join(project_name, "src", project_name), exist_ok=True)
-            progress.update(task_id, completed=True)
+            say("\n[bold cyan]Setting up Python backend:[/bold cyan]")
             
-            # Create version.py
-            task_id = progress.add_task("Creating version.py...", total=None)
-            with open(os.path.join(project_name, "src", project_name, "version.py"), "w") as f:
-                f.write('__version__ = "0.1.0"\n')
-            progress.update(task_id, completed=True)
-
-            # Create __init__.py
-            task_id = progress.add_task("Creating __init__.py...", total=None)
-            with open(os.path.join(project_name, "src", project_name, "__init__.py"), "w") as f:
-                f.write('')
-            progress.update(task_id, completed=True)
-            
-            # Render and write setup.py using our new templating system
-            task_id = progress.add_task("Creating setup.py...", total=None)
-            
-            # Create template context
-            context = TemplateContext({
-                'project_name': project_name,
-                'python_package_name': python_package_name
-            })
-            
-            # Render template to file
-            template_manager.render_to_file(
-                'setup.py.jinja2',
-                os.path.join(project_name, "setup.py"),
-                context
-            )
-            
-            progress.update(task_id, completed=True)
+            # version.py, __init__.py and setup.py
+            pending.append((pkg_dir + "version.py", _VERSION_PY))
+            pending.append((pkg_dir + "__init__.py", b''))
+            pending.append((
+                root + "setup.py",
+                templates['setup.py.jinja2'].render(ctx).encode()
+            ))
+            advance(3)
             
         if frontend:
-            console.print("\n[bold cyan]Setting up Frontend:[/bold cyan]")
-            
-            # Render and write Makefile using our new templating system
-            task_id = progress.add_task("Creating Makefile...", total=None)
-            
-            # Create template context
-            context = TemplateContext({
-                'project_name': project_name,
-                'python_package_name': python_package_name
-            })
-            
-            # Render template to file
-            template_manager.render_to_file(
-                'Makefile.jinja2',
-                os.path.join(project_name, "Makefile"),
-                context
-            )
+            say("\n[bold cyan]Setting up Frontend:[/bold cyan]")
             
-            progress.update(task_id, completed=True)
+            # Render Makefile using our new templating system
+            pending.append((
+                root + "Makefile",
+                templates['Makefile.jinja2'].render(ctx).encode()
+            ))
+            advance()
+
+            # The frontend tooling runs inside the project directory, so
+            # everything rendered so far has to be on disk first
+            _write_files(pending, durable)
+            pending = []
                 
             # Execute frontend setup based on type
             from pathlib import Path
-            project_path = Path(project_name)
-            
-            if frontend_type == 'vue':
-                from .vue_tasks import create_vue_project                 
-                if not create_vue_project(project_name, project_path):
-                    return
-            else:
-                from .react_tasks import create_react_project
-                if not create_react_project(project_name, project_path):
-                    return
-        
-        # Render and write deploy.sh using our new templating system
-        task_id = progress.add_task("Creating deploy.sh...", total=None)
+            create_frontend = _vue_creator() if frontend_type == 'vue' else _react_creator()
+            if not create_frontend(project_name, Path(project_name)):
+                return
+            advance()
         
-        # Create template context
-        context = TemplateContext({
-            'project_name': project_name,
-            'python_package_name': python_package_name
-        })
-        
-        # Render template to file
-        template_manager.render_to_file(
-            'deploy.sh.jinja2',
-            os.path.join(project_name, "deploy.sh"),
-            context
-        )
-        
-        # Make deploy.sh executable
-        os.chmod(os.path.join(project_name, "deploy.sh"), 0o755)
-        
-        progress.update(task_id, completed=True)
+        # Render deploy.sh using our new templating system; it is written
+        # executable
+        pending.append((root + "deploy.sh", templates['deploy.sh.jinja2'].render(ctx).encode(), 0o755))
+        advance()
         
         # Create .gitignore
-        task_id = progress.add_task("Creating .gitignore...", total=None)
-        with open(os.path.join(project_name, ".gitignore"), "w") as f:
-            f.write("web/\nlogs/\n__pycache__/\ndist/\nbuild/\npasted/\n")
-        progress.update(task_id, completed=True)
+        pending.append((root + ".gitignore", _GITIGNORE))
+        advance()
 
         if enable_proxy:
-            # Create proxy.py using our new templating system
-            task_id = progress.add_task("Creating proxy server...", total=None)
-            
-            # Create template context
-            context = TemplateContext({
-                'project_name': project_name,
-                'python_package_name': python_package_name,
+            # Render proxy.py using our new templating system
+            context = base_ctx.extend({
                 'frontend': frontend,
                 'vue': frontend_type == "vue"
             })
             
-            # Render template to file
-            template_manager.render_to_file(
-                'proxy.py.jinja2',
-                os.path.join(project_name, "src", project_name, "proxy.py"),
-                context
-            )
-            
-            progress.update(task_id, completed=True)
-        
-        # Render and write README.md using our new templating system
-        task_id = progress.add_task("Creating README.md...", total=None)
-        
-        # Create template context
-        context = TemplateContext({
-            'project_name': project_name
-        })
-        
-        # Render template to file
-        template_manager.render_to_file(
-            'README.md.jinja2',
-            os.path.join(project_name, "README.md"),
-            context
-        )
+            pending.append((
+                pkg_dir + "proxy.py",
+                templates['proxy.py.jinja2'].render(context.get_merged_context()).encode()
+            ))
+            advance()
         
-        progress.update(task_id, completed=True)
+        # Render README.md using our new templating system
+        pending.append((
+            root + "README.md",
+            templates['README.md.jinja2'].render(ctx).encode()
+        ))
+        advance()
+
+        _write_files(pending, durable)
+
+        if durable:
+            # _write_files flushed the directories holding files; also flush
+            # the entries for src/ and for the project directory itself
+            if backend or enable_proxy:
+                _fsync_dir(root + "src")
+            _fsync_dir(os.path.dirname(os.path.abspath(project_name)))
         
-    console.print(Panel(f"[bold green]Successfully created project: {project_name}[/bold green]"))
+    say(f"[bold green]Successfully created project: {_escape(project_name)}[/bold green]", panel=True)
 
     # If LLM-assisted mode is enabled, set up the LLM integration
     if llm_assisted:
-        console.print("\n[bold cyan]Setting up LLM integration:[/bold cyan]")
+        say("\n[bold cyan]Setting up LLM integration:[/bold cyan]")
         
-        # Create requirements.txt with LLM dependencies
-        with open(os.path.join(project_name, "requirements.txt"), "a") as f:
-            f.write("\n# LLM integration dependencies\nrequests>=2.28.0\n")
+        # Append the LLM dependencies to requirements.txt in a single write
+        _write_small(root + "requirements.txt", _LLM_REQUIREMENTS, append=True, durable=durable)
         
-        console.print("[green]Added LLM dependencies to requirements.txt[/green]")
-        console.print(Panel("[bold yellow]To use LLM-assisted features, set your API keys as environment variables:[/bold yellow]\n\nFor OpenAI: export OPENAI_API_KEY=your_key_here\nFor Anthropic: export ANTHROPIC_API_KEY=your_key_here"))
-
+        say("[green]Added LLM dependencies to requirements.txt[/green]")
+        say("[bold yellow]To use LLM-assisted features, set your API keys as environment variables:[/bold yellow]\n\nFor OpenAI: export OPENAI_API_KEY=your_key_here\nFor Anthropic: export ANTHROPIC_API_KEY=your_key_here")
 
 @cli.command()
 @click.argument('description')
@@ -263,25 +422,26 @@ def create(project_name, backend, frontend, frontend_type, enable_proxy, llm_ass
               type=click.Choice(['openai', 'anthropic'], case_sensitive=False),
               default='openai',
               help='LLM provider to use (default: openai)')
-def genie(description, project_path, llm_provider):
+@click.option('--cache', is_flag=True,
+              help='Reuse earlier responses to identical prompts, stored in '
+                   '$XDG_CACHE_HOME/projects_tools/llm_cache (default ~/.cache)')
+def genie(description, project_path, llm_provider, cache):
     """Generate code based on natural language description"""
-    console.print(Panel(f"[bold blue]Project Genie: Generating from description[/bold blue]"))
+    say(f"[bold blue]Project Genie: Generating from description[/bold blue]", panel=True)
     
     try:
-        from .llm_integration import ProjectGenie
-        
-        genie = ProjectGenie(project_path, llm_provider)
+        genie = _genie(project_path, llm_provider, cache)
         components = genie.generate_from_description(description)
         
-        console.print(f"[green]Successfully generated {len(components)} components:[/green]")
+        say(f"[green]Successfully generated {len(components)} components:[/green]")
         for component in components:
-            console.print(f"- {component['name']}: {component['path']}")
+            say(f"- {_escape(component['name'])}: {_escape(component['path'])}")
     except ImportError:
-        console.print("[red]Error: LLM integration module not found.[/red]")
-        console.print("[yellow]Make sure you have the required dependencies installed:[/yellow]")
-        console.print("pip install requests")
+        say("[red]Error: LLM integration module not found.[/red]")
+        say("[yellow]Make sure you have the required dependencies installed:[/yellow]")
+        say("pip install requests")
     except Exception as e:
-        console.print(f"[red]Error generating code: {str(e)}[/red]")
+        say(f"[red]Error generating code: {_escape(e)}[/red]")
 
 
 @cli.command()
@@ -294,24 +454,22 @@ def genie(description, project_path, llm_provider):
               help='LLM provider to use (default: openai)')
 def debug(component_path, issue_description, project_path, llm_provider):
     """Debug a component based on issue description"""
-    console.print(Panel(f"[bold blue]Debugging component: {component_path}[/bold blue]"))
+    say(f"[bold blue]Debugging component: {_escape(component_path)}[/bold blue]", panel=True)
     
     try:
-        from .llm_integration import ProjectGenie
-        
-        genie = ProjectGenie(project_path, llm_provider)
+        genie = _genie(project_path, llm_provider)
         success = genie.debug_component(component_path, issue_description)
         
         if success:
-            console.print(f"[green]Successfully debugged component: {component_path}[/green]")
+            say(f"[green]Successfully debugged component: {_escape(component_path)}[/green]")
         else:
-            console.print(f"[red]Failed to debug component: {component_path}[/red]")
+            say(f"[red]Failed to debug component: {_escape(component_path)}[/red]")
     except ImportError:
-        console.print("[red]Error: LLM integration module not found.[/red]")
-        console.print("[yellow]Make sure you have the required dependencies installed:[/yellow]")
-        console.print("pip install requests")
+        say("[red]Error: LLM integration module not found.[/red]")
+        say("[yellow]Make sure you have the required dependencies installed:[/yellow]")
+        say("pip install requests")
     except Exception as e:
-        console.print(f"[red]Error debugging component: {str(e)}[/red]")
+        say(f"[red]Error debugging component: {_escape(e)}[/red]")
 
 
 @cli.command()
@@ -325,12 +483,10 @@ def debug(component_path, issue_description, project_path, llm_provider):
               help='LLM provider to use (default: openai)')
 def analyze_codebase(project_path, include_patterns, exclude_patterns, output_file, llm_provider):
     """Analyze a codebase and generate insights"""
-    console.print(Panel(f"[bold blue]Analyzing codebase: {project_path}[/bold blue]"))
+    say(f"[bold blue]Analyzing codebase: {_escape(project_path)}[/bold blue]", panel=True)
     
     try:
-        from .llm_integration import ProjectGenie
-        
-        genie = ProjectGenie(project_path, llm_provider)
+        genie = _genie(project_path, llm_provider)
         
         # Convert include/exclude patterns to lists
         include_patterns_list = list(include_patterns) if include_patterns else None
@@ -340,19 +496,19 @@ def analyze_codebase(project_path, include_patterns, exclude_patterns, output_fi
         analysis_results = genie.analyze_codebase(include_patterns_list, exclude_patterns_list)
         
         # Visualize the dependency graph
-        console.print("\n[bold cyan]Dependency Graph:[/bold cyan]")
+        say("\n[bold cyan]Dependency Graph:[/bold cyan]")
         genie.visualize_dependency_graph()
         
         # Export analysis results if requested
         if output_file:
             if genie.export_analysis(output_file):
-                console.print(f"[green]Analysis results exported to {output_file}[/green]")
+                say(f"[green]Analysis results exported to {_escape(output_file)}[/green]")
     except ImportError:
-        console.print("[red]Error: LLM integration module not found.[/red]")
-        console.print("[yellow]Make sure you have the required dependencies installed:[/yellow]")
-        console.print("pip install requests")
+        say("[red]Error: LLM integration module not found.[/red]")
+        say("[yellow]Make sure you have the required dependencies installed:[/yellow]")
+        say("pip install requests")
     except Exception as e:
-        console.print(f"[red]Error analyzing codebase: {str(e)}[/red]")
+        say(f"[red]Error analyzing codebase: {_escape(e)}[/red]")
 
 
 @cli.command()
@@ -365,20 +521,15 @@ def analyze_codebase(project_path, include_patterns, exclude_patterns, output_fi
 @click.option('--preview', is_flag=True, help='Preview the component without generating files')
 def generate_component(component_name, output_dir, module_name, module_description, class_name, data_type, preview):
     """Generate a component from a template"""
+    from rich.panel import Panel
+
+    console = _console()
+    component_generator = _component_generator()
+
     console.print(Panel(f"[bold blue]Generating component: {component_name}[/bold blue]"))
     
     # Create template context
-    context = TemplateContext({
-        'module_name': module_name,
-        'module_description': module_description,
-        'class_name': class_name,
-        'class_name_variable': class_name.lower(),
-        'output_dir': output_dir
-    })
-    
-    # Add data_type if provided
-    if data_type:
-        context.set('data_type', data_type)
+    context = _std_context(module_name, module_description, class_name, data_type, output_dir=output_dir)
     
     try:
         if preview:
@@ -405,6 +556,11 @@ def generate_component(component_name, output_dir, module_name, module_descripti
 @cli.command()
 def list_components():
     """List available components"""
+    from rich.panel import Panel
+
+    console = _console()
+    component_generator = _component_generator()
+
     console.print(Panel(f"[bold blue]Available Components[/bold blue]"))
     
     # List base components
@@ -433,19 +589,15 @@ def list_components():
 @click.option('--data-type', '-t', help='Data type (for data processor component)')
 def generate_from_pattern(pattern_id, output_file, module_name, module_description, class_name, data_type):
     """Generate content from a pattern"""
+    from rich.panel import Panel
+
+    console = _console()
+    pattern_generator = _pattern_generator()
+
     console.print(Panel(f"[bold blue]Generating from pattern: {pattern_id}[/bold blue]"))
     
     # Create template context
-    context = TemplateContext({
-        'module_name': module_name,
-        'module_description': module_description,
-        'class_name': class_name,
-        'class_name_variable': class_name.lower()
-    })
-    
-    # Add data_type if provided
-    if data_type:
-        context.set('data_type', data_type)
+    context = _std_context(module_name, module_description, class_name, data_type)
     
     try:
         # Generate content
@@ -465,6 +617,11 @@ def generate_from_pattern(pattern_id, output_file, module_name, module_descripti
 @cli.command()
 def list_patterns():
     """List available patterns"""
+    from rich.panel import Panel
+
+    console = _console()
+    template_registry = _template_registry()
+
     console.print(Panel(f"[bold blue]Available Patterns[/bold blue]"))
     
     # List templates
@@ -509,19 +666,15 @@ def list_patterns():
 @click.option('--preview', is_flag=True, help='Preview the layout without generating files')
 def generate_layout(layout_id, output_dir, module_name, module_description, class_name, data_type, preview):
     """Generate a layout"""
+    from rich.panel import Panel
+
+    console = _console()
+    layout_generator = _layout_generator()
+
     console.print(Panel(f"[bold blue]Generating layout: {layout_id}[/bold blue]"))
     
     # Create template context
-    context = TemplateContext({
-        'module_name': module_name,
-        'module_description': module_description,
-        'class_name': class_name,
-        'class_name_variable': class_name.lower()
-    })
-    
-    # Add data_type if provided
-    if data_type:
-        context.set('data_type', data_type)
+    context = _std_context(module_name, module_description, class_name, data_type)
     
     try:
         if preview:
@@ -548,6 +701,11 @@ def generate_layout(layout_id, output_dir, module_name, module_description, clas
 @cli.command()
 def list_layouts():
     """List available layouts"""
+    from rich.panel import Panel
+
+    console = _console()
+    layout_generator = _layout_generator()
+
     console.print(Panel(f"[bold blue]Available Layouts[/bold blue]"))
     
     # List layouts
@@ -564,27 +722,31 @@ def list_layouts():
 @click.option('--fields-json', '-f', required=True, help='JSON string of fields')
 def generate_from_algorithm(algorithm_id, output_file, model_name, fields_json):
     """Generate content from an algorithm"""
+    try:
+        # orjson is optional and parses large field lists faster
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    from rich.panel import Panel
+
+    console = _console()
+    pattern_generator = _pattern_generator()
+
     console.print(Panel(f"[bold blue]Generating from algorithm: {algorithm_id}[/bold blue]"))
     
     try:
         # Parse fields JSON
-        fields = json.loads(fields_json)
+        fields = loads(fields_json)
         
         # Generate content
-        if algorithm_id == 'generate_crud_operations':
-            content = pattern_generator.generate_from_algorithm(
-                algorithm_id,
-                {'model_name': model_name, 'fields': fields},
-                output_file
-            )
-        elif algorithm_id == 'generate_form_validation':
-            content = pattern_generator.generate_from_algorithm(
-                algorithm_id,
-                {'form_name': model_name, 'fields': fields},
-                output_file
-            )
-        else:
+        name_param = _ALGORITHM_NAME_PARAMS.get(algorithm_id)
+        if name_param is None:
             raise ValueError(f"Unknown algorithm: {algorithm_id}")
+        content = pattern_generator.generate_from_algorithm(
+            algorithm_id,
+            {name_param: model_name, 'fields': fields},
+            output_file
+        )
         
         if output_file:
             console.print(f"[green]Successfully generated content to {output_file}[/green]")
@@ -606,15 +768,15 @@ def generate_from_algorithm(algorithm_id, output_file, model_name, fields_json):
 @click.option('--class-name', '-c', required=True, help='Class name')
 def generate_by_metadata(metadata_key, metadata_value, output_dir, module_name, module_description, class_name):
     """Generate content by metadata"""
+    from rich.panel import Panel
+
+    console = _console()
+    pattern_generator = _pattern_generator()
+
     console.print(Panel(f"[bold blue]Generating content by metadata: {metadata_key}={metadata_value}[/bold blue]"))
     
     # Create template context
-    context = TemplateContext({
-        'module_name': module_name,
-        'module_description': module_description,
-        'class_name': class_name,
-        'class_name_variable': class_name.lower()
-    })
+    context = _std_context(module_name, module_description, class_name)
     
     try:
         # Generate content
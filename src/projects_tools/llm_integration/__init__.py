@@ -4,17 +4,68 @@ LLM integration package for project_tools.
 This package provides functionality for LLM-assisted project generation.
 """
 
-from .project_genie import ProjectGenie
-from .llm_client import LLMClient, get_llm_client
-from .context_manager import ProjectContext
-from .code_generator import CodeGenerator
-from .validator import CodeValidator, ValidationResult
-from .runtime_validator import RuntimeValidator, RuntimeValidationResult
-from .db_schema_generator import DBSchemaGenerator
-from .test_generator import TestGenerator
-from .codebase_analyzer import CodebaseAnalyzer, DependencyGraph, CodeMetrics
-from .error_collector import ErrorCollector, ErrorPattern, ErrorInstance
-from .feedback_loop import FeedbackLoop, FeedbackEntry
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from .project_genie import ProjectGenie
+    from .llm_client import LLMClient, get_llm_client
+    from .context_manager import ProjectContext
+    from .code_generator import CodeGenerator
+    from .validator import CodeValidator, ValidationResult
+    from .runtime_validator import RuntimeValidator, RuntimeValidationResult
+    from .db_schema_generator import DBSchemaGenerator
+    from .test_generator import TestGenerator
+    from .codebase_analyzer import CodebaseAnalyzer, DependencyGraph, CodeMetrics
+    from .error_collector import ErrorCollector, ErrorPattern, ErrorInstance
+    from .feedback_loop import FeedbackLoop, FeedbackEntry
+
+# Submodules are imported on first attribute access so that using one class,
+# e.g. ProjectGenie from the CLI, does not import every other submodule.
+# Maps attribute name -> submodule.
+_lazy_imports: Dict[str, str] = {
+    'ProjectGenie': '.project_genie',
+    'LLMClient': '.llm_client',
+    'get_llm_client': '.llm_client',
+    'ProjectContext': '.context_manager',
+    'CodeGenerator': '.code_generator',
+    'CodeValidator': '.validator',
+    'ValidationResult': '.validator',
+    'RuntimeValidator': '.runtime_validator',
+    'RuntimeValidationResult': '.runtime_validator',
+    'DBSchemaGenerator': '.db_schema_generator',
+    'TestGenerator': '.test_generator',
+    'CodebaseAnalyzer': '.codebase_analyzer',
+    'DependencyGraph': '.codebase_analyzer',
+    'CodeMetrics': '.codebase_analyzer',
+    'ErrorCollector': '.error_collector',
+    'ErrorPattern': '.error_collector',
+    'ErrorInstance': '.error_collector',
+    'FeedbackLoop': '.feedback_loop',
+    'FeedbackEntry': '.feedback_loop',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve lazily exported attributes on first access.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        The resolved attribute.
+
+    Raises:
+        AttributeError: If the attribute is not a lazy export.
+    """
+    if name in _lazy_imports:
+        module = importlib.import_module(_lazy_imports[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'ProjectGenie',
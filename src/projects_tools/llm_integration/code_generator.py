@@ -4,8 +4,12 @@ Code Generator module for LLM integration.
 This module provides functionality to generate code using LLMs.
 """
 
+import hashlib
 import os
 import re
+import shelve
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from rich.console import Console
@@ -16,18 +20,59 @@ from .context_manager import ProjectContext
 
 console = Console()
 
+# Upper bound on LLM requests in flight while generating from a description
+_MAX_CONCURRENT_REQUESTS = 8
+
+# Patterns for pulling code and JSON out of LLM responses
+_CODE_BLOCK_RE = re.compile(r"```(?:\w+)?\s*([\s\S]+?)\s*```")
+_JSON_ARRAY_START_RE = re.compile(r"\[\s*\{")
+
+# Bump to discard cached responses when the prompts change shape
+_RESPONSE_CACHE_VERSION = 1
+
+
+def _response_cache_path() -> Optional[str]:
+    """Return the path of the persistent LLM response cache.
+    
+    Returns:
+        Path for the shelve database, or None if no writable cache directory
+        is available.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    cache_dir = os.path.join(cache_home, "projects_tools")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        return None
+    if not os.access(cache_dir, os.W_OK):
+        return None
+    return os.path.join(cache_dir, "llm_cache")
+
 class CodeGenerator:
     """Generates code using LLMs."""
     
-    def __init__(self, llm_client: LLMClient, project_context: ProjectContext):
+    def __init__(self, llm_client: LLMClient, project_context: ProjectContext,
+                 use_cache: bool = False):
         """Initialize code generator.
         
         Args:
             llm_client: LLM client to use for generation.
             project_context: Project context to use for generation.
+            use_cache: Whether to reuse responses to identical prompts, both
+                within this run and across runs. Responses are stored in
+                $XDG_CACHE_HOME/projects_tools/llm_cache (by default
+                ~/.cache/projects_tools/llm_cache); delete it to clear the
+                cache. Off by default, since rerunning a prompt is usually
+                meant to produce a new answer.
         """
         self.llm_client = llm_client
         self.project_context = project_context
+        self.use_cache = use_cache
+        
+        # Responses keyed by model and prompt hash; see _generate
+        self._response_cache: Dict[str, str] = {}
+        self._cache_path = _response_cache_path() if use_cache else None
+        self._cache_lock = threading.Lock()
         
     def generate_component(self, component_type: str, name: str, description: str, 
                           path: Optional[str] = None) -> Tuple[bool, str]:
@@ -59,8 +104,74 @@ class CodeGenerator:
         
         # Generate the code
         console.print(f"[cyan]Generating code for {name}...[/cyan]")
-        code = self.llm_client.generate(prompt)
+        code = self._generate(prompt)
+        
+        return self._save_component(component_type, name, description, path, code)
+    
+    def _generate(self, prompt: str) -> str:
+        """Generate a response, reusing the cached response to an identical prompt.
+        
+        Responses are keyed by client, model and the SHA-256 of the prompt, so
+        switching models never returns stale output. Empty responses signal an
+        API error and are not cached.
+        
+        Args:
+            prompt: The prompt to generate from.
+            
+        Returns:
+            Generated text.
+        """
+        if not self.use_cache:
+            return self.llm_client.generate(prompt)
+        
+        key = "{}:{}:{}:{}".format(
+            _RESPONSE_CACHE_VERSION,
+            type(self.llm_client).__name__,
+            getattr(self.llm_client, "model", ""),
+            hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        )
+        
+        with self._cache_lock:
+            response = self._response_cache.get(key)
+            if response is None and self._cache_path is not None:
+                try:
+                    with shelve.open(self._cache_path) as db:
+                        response = db.get(key)
+                except Exception:
+                    self._cache_path = None
+            if response is not None:
+                self._response_cache[key] = response
+                return response
+        
+        response = self.llm_client.generate(prompt)
+        if not response:
+            return response
         
+        with self._cache_lock:
+            self._response_cache[key] = response
+            if self._cache_path is not None:
+                try:
+                    with shelve.open(self._cache_path) as db:
+                        db[key] = response
+                except Exception:
+                    self._cache_path = None
+        
+        return response
+    
+    def _save_component(self, component_type: str, name: str, description: str,
+                        path: str, code: str) -> Tuple[bool, str]:
+        """Save generated code for a component and record it in the project context.
+        
+        Args:
+            component_type: Type of component.
+            name: Name of the component.
+            description: Description of the component.
+            path: Path to save the component to, relative to the project.
+            code: Raw LLM response for the component.
+            
+        Returns:
+            Tuple of (success, file_path).
+        """
         if not code:
             console.print(f"[red]Failed to generate code for {name}[/red]")
             return False, ""
@@ -109,6 +220,10 @@ class CodeGenerator:
     def _create_component_prompt(self, component_type: str, name: str, description: str) -> str:
         """Create a prompt for generating a component.
         
+        The prompt starts with a preamble that depends only on the component
+        type and project, so consecutive prompts share a prefix that provider
+        prompt caches can reuse. The per-component request comes last.
+        
         Args:
             component_type: Type of component.
             name: Name of the component.
@@ -118,13 +233,22 @@ class CodeGenerator:
             Prompt string.
         """
         project_name = self.project_context.project_path.name
+        return self._component_prompt_preamble(component_type, project_name) + \
+            self._component_prompt_request(component_type, name, description)
+    
+    def _component_prompt_preamble(self, component_type: str, project_name: str) -> str:
+        """Create the static part of a component prompt.
         
+        Args:
+            component_type: Type of component.
+            project_name: Name of the project.
+            
+        Returns:
+            Preamble string.
+        """
         if component_type == "frontend":
             return f"""
-You are an expert React/TypeScript developer. Create a React component named {name} for the {project_name} project.
-
-Component Description:
-{description}
+You are an expert React/TypeScript developer working on the {project_name} project.
 
 Requirements:
 - Use TypeScript with proper type definitions
@@ -137,10 +261,7 @@ Return only the code without any explanations or markdown formatting.
 """
         elif component_type == "backend":
             return f"""
-You are an expert Python developer. Create a Python module named {name} for the {project_name} project.
-
-Module Description:
-{description}
+You are an expert Python developer working on the {project_name} project.
 
 Requirements:
 - Use modern Python 3.9+ features
@@ -153,10 +274,7 @@ Return only the code without any explanations or markdown formatting.
 """
         else:
             return f"""
-You are an expert software developer. Create a {component_type} component named {name} for the {project_name} project.
-
-Component Description:
-{description}
+You are an expert software developer working on the {project_name} project.
 
 Requirements:
 - Use best practices for {component_type} development
@@ -165,6 +283,39 @@ Requirements:
 - Make the code modular and well-structured
 
 Return only the code without any explanations or markdown formatting.
+"""
+    
+    def _component_prompt_request(self, component_type: str, name: str, description: str) -> str:
+        """Create the per-component part of a component prompt.
+        
+        Args:
+            component_type: Type of component.
+            name: Name of the component.
+            description: Description of the component.
+            
+        Returns:
+            Request string.
+        """
+        if component_type == "frontend":
+            return f"""
+Create a React component named {name}.
+
+Component Description:
+{description}
+"""
+        elif component_type == "backend":
+            return f"""
+Create a Python module named {name}.
+
+Module Description:
+{description}
+"""
+        else:
+            return f"""
+Create a {component_type} component named {name}.
+
+Component Description:
+{description}
 """
     
     def _extract_code_from_response(self, response: str) -> str:
@@ -176,9 +327,26 @@ Return only the code without any explanations or markdown formatting.
         Returns:
             Extracted code string.
         """
-        # Try to extract code from markdown code blocks
-        code_block_pattern = r"```(?:\w+)?\s*([\s\S]+?)\s*```"
-        matches = re.findall(code_block_pattern, response)
+        # Fast path: scan for the first fenced block with str.find. Skipping
+        # the word characters after the opening fence mirrors the optional
+        # language tag in the pattern below, so a non-blank body up to the
+        # next fence is exactly what the pattern would capture.
+        start = response.find("```")
+        if start == -1:
+            return response.strip()
+        
+        body_start = start + 3
+        while body_start < len(response) and (response[body_start].isalnum() or response[body_start] == "_"):
+            body_start += 1
+        
+        end = response.find("```", body_start)
+        if end != -1:
+            code = response[body_start:end].strip()
+            if code:
+                return code
+        
+        # Fall back to the pattern for unterminated or empty blocks
+        matches = _CODE_BLOCK_RE.findall(response)
         
         if matches:
             return matches[0].strip()
@@ -186,6 +354,55 @@ Return only the code without any explanations or markdown formatting.
         # If no code blocks found, return the whole response
         return response.strip()
     
+    def _extract_json_array(self, response: str) -> List[Dict[str, Any]]:
+        """Extract a JSON array of objects from LLM response.
+        
+        The array spans from the first "[" that opens an object to the last
+        "]" that closes one, located with str.rfind rather than a
+        backtracking pattern. If trailing text makes that span invalid, the
+        first complete array is decoded instead.
+        
+        Args:
+            response: LLM response string.
+            
+        Returns:
+            Parsed list of objects.
+            
+        Raises:
+            ValueError: If no JSON array can be found or parsed.
+        """
+        try:
+            # orjson is optional and parses large responses faster
+            from orjson import loads
+        except ImportError:
+            from json import loads
+        
+        start_match = _JSON_ARRAY_START_RE.search(response)
+        if start_match:
+            start = start_match.start()
+            # The object needs a body, so its closing brace is at least two
+            # characters after the opening one
+            min_close = start_match.end() + 1
+            end = response.rfind("]")
+            while end > min_close:
+                close = end - 1
+                while close >= min_close and response[close].isspace():
+                    close -= 1
+                if close >= min_close and response[close] == "}":
+                    break
+                end = response.rfind("]", 0, end)
+            else:
+                end = -1
+            
+            if end != -1:
+                try:
+                    return loads(response[start:end + 1])
+                except ValueError:
+                    import json
+                    return json.JSONDecoder().raw_decode(response, start)[0]
+        
+        raise ValueError("Failed to extract JSON from LLM response")
+    
     def generate_from_description(self, description: str) -> List[Dict[str, Any]]:
         """Generate components from a natural language description.
         
@@ -225,18 +442,11 @@ Return only the JSON without any explanations or markdown formatting.
 """
         
         console.print(f"[cyan]Parsing description into components...[/cyan]")
-        parsed_response = self.llm_client.generate(parsing_prompt)
+        parsed_response = self._generate(parsing_prompt)
         
         try:
             # Extract JSON from the response
-            json_pattern = r"\[\s*\{[\s\S]+\}\s*\]"
-            json_match = re.search(json_pattern, parsed_response)
-            
-            if json_match:
-                import json
-                components_to_generate = json.loads(json_match.group(0))
-            else:
-                raise ValueError("Failed to extract JSON from LLM response")
+            components_to_generate = self._extract_json_array(parsed_response)
                 
             # Add the requirements to the project context
             for component in components_to_generate:
@@ -245,14 +455,28 @@ Return only the JSON without any explanations or markdown formatting.
                     category=component["type"]
                 )
             
-            # Generate each component
+            # The components are independent, so request all of them at once
+            # and write the results in order once they have arrived
+            prompts = [
+                self._create_component_prompt(component["type"], component["name"], component["description"])
+                for component in components_to_generate
+            ]
+            codes = []
+            if prompts:
+                console.print(f"[cyan]Generating code for {len(prompts)} components...[/cyan]")
+                with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_REQUESTS, len(prompts))) as executor:
+                    codes = list(executor.map(self._generate, prompts))
+            
+            # Save each component
             generated_components = []
-            for component in components_to_generate:
-                success, path = self.generate_component(
+            for component, code in zip(components_to_generate, codes):
+                console.print(Panel(f"[bold blue]Generating {component['type']} component: {component['name']}[/bold blue]"))
+                success, path = self._save_component(
                     component_type=component["type"],
                     name=component["name"],
                     description=component["description"],
-                    path=component["path"]
+                    path=component["path"],
+                    code=code
                 )
                 
                 if success:
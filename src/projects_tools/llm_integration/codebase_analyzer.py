@@ -7,8 +7,14 @@ This module provides functionality to analyze a codebase and extract insights.
 import os
 import re
 import ast
+import gzip
+import heapq
 import json
 import subprocess
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, List, Optional, Any, Tuple, Set
 from pathlib import Path
 from rich.console import Console
@@ -17,13 +23,172 @@ from rich.tree import Tree
 
 console = Console()
 
+# Simplified ES module import and CommonJS require patterns
+_IMPORT_RE = re.compile(r'import\s+(?:{[^}]*}|[^{}\n;]+)\s+from\s+[\'"]([^\'"]+)[\'"]')
+_REQUIRE_RE = re.compile(r'(?:const|let|var)\s+(?:{[^}]*}|[^{}\n;]+)\s+=\s+require\([\'"]([^\'"]+)[\'"]\)')
+
+# Branching constructs counted towards simplified JS complexity. No token can
+# start inside another, so one scan finds exactly what separate
+# str.count calls would.
+_JS_BRANCH_RE = re.compile(r'if |else |for |while |switch |case |&&|\|\||\?')
+
+# ASCII line boundaries other than "\n" that text mode or str.splitlines
+# treat specially (the non-ASCII ones only occur in non-ASCII files)
+_SPECIAL_LINE_BREAKS = b'\r\x0b\x0c\x1c\x1d\x1e'
+
+# Include patterns of the form "**/*<suffix>" and exclude patterns of the
+# form "**/<dir>/**" can be served by a single directory walk
+_SUFFIX_PATTERN_RE = re.compile(r'\*\*/\*([^*?\[\]/]*)')
+_DIR_PATTERN_RE = re.compile(r'\*\*/([^*?\[\]/]+)/\*\*')
+
+# Node types that each add one to Python cyclomatic complexity
+_BRANCH_NODES = frozenset((ast.If, ast.While, ast.For))
+
+# Path keywords that hint at architectural patterns
+_ARCHITECTURE_KEYWORDS = ("model", "view", "controller", "repo", "service")
+
+# Below this many files, starting worker processes costs more than it saves
+_PARALLEL_MIN_FILES = 64
+_PARALLEL_CHUNKSIZE = 32
+
+
+def _parse_python(content: str) -> Tuple[List[str], int]:
+    """Extract imports and complexity from Python source.
+    
+    Args:
+        content: Content of the file.
+        
+    Returns:
+        Tuple of (imports, cyclomatic complexity).
+        
+    Raises:
+        SyntaxError: If the source cannot be parsed.
+    """
+    return _scan_python_tree(ast.parse(content))
+
+
+def _scan_python_tree(tree: ast.AST) -> Tuple[List[str], int]:
+    """Extract imports and cyclomatic complexity from a Python AST.
+    
+    Args:
+        tree: AST of the Python code.
+        
+    Returns:
+        Tuple of (imports, cyclomatic complexity).
+    """
+    # Extract imports and calculate cyclomatic complexity in one walk. This
+    # is ast.walk inlined, visiting nodes in the same breadth-first order so
+    # imports keep their order, and dispatching on the exact node type since
+    # the parser never produces subclasses.
+    imports = []
+    complexity = 1  # Base complexity
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        todo.extend(ast.iter_child_nodes(node))
+        node_type = type(node)
+        if node_type in _BRANCH_NODES:
+            complexity += 1
+        elif node_type is ast.BoolOp:
+            complexity += len(node.values) - 1
+        elif node_type is ast.Import:
+            for name in node.names:
+                imports.append(name.name)
+        elif node_type is ast.ImportFrom:
+            if node.module:
+                for name in node.names:
+                    imports.append(f"{node.module}.{name.name}")
+        elif node_type is ast.Try:
+            complexity += len(node.handlers)
+    
+    return imports, complexity
+
+
+def _parse_javascript(content: str) -> Tuple[List[str], int]:
+    """Extract imports and complexity from JavaScript/TypeScript source.
+    
+    Args:
+        content: Content of the file.
+        
+    Returns:
+        Tuple of (imports, cyclomatic complexity).
+    """
+    # Extract imports using regex (simplified). Each pattern needs a
+    # literal keyword, so files without it skip the regex entirely.
+    imports = []
+    if "import" in content:
+        for match in _IMPORT_RE.finditer(content):
+            imports.append(match.group(1))
+    
+    if "require(" in content:
+        for match in _REQUIRE_RE.finditer(content):
+            imports.append(match.group(1))
+    
+    # Calculate cyclomatic complexity (simplified) in a single pass
+    complexity = len(_JS_BRANCH_RE.findall(content)) + 1
+    
+    return imports, complexity
+
+
+def _analyze_file_worker(args: Tuple[str, str]) -> Tuple[str, Optional[Tuple[List[str], int, int]], Optional[str]]:
+    """Analyze one file without touching any shared state.
+    
+    This runs in worker processes, so problems are returned as console
+    messages for the parent to print rather than printed here.
+    
+    Args:
+        args: Tuple of (project path, file path relative to it).
+        
+    Returns:
+        Tuple of (file path, (imports, complexity, lines of code) or None,
+        console message or None).
+    """
+    project_path, file_path = args
+    full_path = os.path.join(project_path, file_path)
+    
+    try:
+        # Read bytes and decode once rather than through a text wrapper
+        with open(full_path, 'rb', buffering=0) as f:
+            raw = f.read()
+        content = raw.decode('utf-8')
+        
+        if content.isascii() and len(raw.translate(None, _SPECIAL_LINE_BREAKS)) == len(raw):
+            # Only "\n" breaks lines, so counting bytes matches splitlines
+            lines_of_code = raw.count(b'\n')
+            if raw and not raw.endswith(b'\n'):
+                lines_of_code += 1
+        else:
+            # Translate newlines as text mode would and count like splitlines
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+            lines_of_code = len(content.splitlines())
+        
+        # Determine file type
+        file_ext = os.path.splitext(file_path)[1].lower()
+        
+        if file_ext == '.py':
+            try:
+                imports, complexity = _parse_python(content)
+            except SyntaxError:
+                return file_path, None, f"[yellow]Syntax error in {file_path}, skipping analysis[/yellow]"
+        elif file_ext in ['.js', '.jsx', '.ts', '.tsx']:
+            imports, complexity = _parse_javascript(content)
+        else:
+            return file_path, None, None
+        
+        return file_path, (imports, complexity, lines_of_code), None
+    except Exception as e:
+        return file_path, None, f"[red]Error analyzing file {file_path}: {str(e)}[/red]"
+
+
 class DependencyGraph:
     """Represents a dependency graph of a codebase."""
     
     def __init__(self):
         """Initialize dependency graph."""
         self.nodes = {}  # type: Dict[str, Set[str]]
+        self.reverse_nodes = {}  # type: Dict[str, Set[str]]
         self.metadata = {}  # type: Dict[str, Dict[str, Any]]
+        self.edges = {}  # type: Dict[str, Dict[str, Dict[str, Any]]]
     
     def add_node(self, node_id: str, metadata: Dict[str, Any] = None):
         """Add a node to the graph.
@@ -34,6 +199,7 @@ class DependencyGraph:
         """
         if node_id not in self.nodes:
             self.nodes[node_id] = set()
+            self.reverse_nodes[node_id] = set()
             self.metadata[node_id] = metadata or {}
     
     def add_edge(self, from_node: str, to_node: str, metadata: Dict[str, Any] = None):
@@ -47,10 +213,10 @@ class DependencyGraph:
         self.add_node(from_node)
         self.add_node(to_node)
         self.nodes[from_node].add(to_node)
+        self.reverse_nodes[to_node].add(from_node)
         
-        # Store edge metadata
-        edge_key = f"{from_node}_{to_node}"
-        self.metadata[edge_key] = metadata or {}
+        # Store edge metadata under the source node, apart from node metadata
+        self.edges.setdefault(from_node, {})[to_node] = metadata or {}
     
     def get_dependencies(self, node_id: str) -> Set[str]:
         """Get dependencies of a node.
@@ -72,11 +238,19 @@ class DependencyGraph:
         Returns:
             Set of node IDs that depend on the given node.
         """
-        dependents = set()
-        for node, deps in self.nodes.items():
-            if node_id in deps:
-                dependents.add(node)
-        return dependents
+        return set(self.reverse_nodes.get(node_id, ()))
+    
+    def get_edge_metadata(self, from_node: str, to_node: str) -> Dict[str, Any]:
+        """Get metadata of an edge.
+        
+        Args:
+            from_node: ID of the source node.
+            to_node: ID of the target node.
+            
+        Returns:
+            Metadata of the edge, or an empty dictionary if there is no edge.
+        """
+        return self.edges.get(from_node, {}).get(to_node, {})
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the graph to a dictionary.
@@ -86,7 +260,8 @@ class DependencyGraph:
         """
         return {
             "nodes": {node: list(deps) for node, deps in self.nodes.items()},
-            "metadata": self.metadata
+            "metadata": self.metadata,
+            "edges": self.edges
         }
     
     @classmethod
@@ -102,6 +277,24 @@ class DependencyGraph:
         graph = cls()
         graph.nodes = {node: set(deps) for node, deps in data.get("nodes", {}).items()}
         graph.metadata = data.get("metadata", {})
+        graph.edges = data.get("edges")
+        
+        if graph.edges is None:
+            # Older exports kept edge metadata among the node metadata under
+            # "<from>_<to>" keys; move it to the edge map
+            graph.metadata = dict(graph.metadata)
+            graph.edges = {}
+            for node, deps in graph.nodes.items():
+                for dep in deps:
+                    edge_key = f"{node}_{dep}"
+                    if edge_key in graph.metadata and edge_key not in graph.nodes:
+                        graph.edges.setdefault(node, {})[dep] = graph.metadata.pop(edge_key)
+        
+        # Rebuild the reverse index
+        graph.reverse_nodes = {node: set() for node in graph.nodes}
+        for node, deps in graph.nodes.items():
+            for dep in deps:
+                graph.reverse_nodes.setdefault(dep, set()).add(node)
         return graph
     
     def visualize(self) -> Tree:
@@ -130,6 +323,8 @@ class CodeMetrics:
     def __init__(self):
         """Initialize code metrics."""
         self.metrics = {}  # type: Dict[str, Dict[str, Any]]
+        self._complexities = {}  # type: Dict[str, Any]
+        self._complexity_total = 0
     
     def add_file_metrics(self, file_path: str, metrics: Dict[str, Any]):
         """Add metrics for a file.
@@ -139,6 +334,15 @@ class CodeMetrics:
             metrics: Dictionary of metrics.
         """
         self.metrics[file_path] = metrics
+        
+        # Keep the complexity column and its running total in step with the
+        # per-file dictionaries
+        if "cyclomatic_complexity" in metrics:
+            complexity = metrics["cyclomatic_complexity"]
+            self._complexity_total += complexity - self._complexities.get(file_path, 0)
+            self._complexities[file_path] = complexity
+        else:
+            self._complexity_total -= self._complexities.pop(file_path, 0)
     
     def get_file_metrics(self, file_path: str) -> Dict[str, Any]:
         """Get metrics for a file.
@@ -157,15 +361,10 @@ class CodeMetrics:
         Returns:
             Average complexity.
         """
-        complexities = []
-        for file_metrics in self.metrics.values():
-            if "cyclomatic_complexity" in file_metrics:
-                complexities.append(file_metrics["cyclomatic_complexity"])
-        
-        if not complexities:
+        if not self._complexities:
             return 0.0
         
-        return sum(complexities) / len(complexities)
+        return self._complexity_total / len(self._complexities)
     
     def get_highest_complexity_files(self, limit: int = 5) -> List[Tuple[str, float]]:
         """Get files with highest cyclomatic complexity.
@@ -176,12 +375,7 @@ class CodeMetrics:
         Returns:
             List of (file_path, complexity) tuples.
         """
-        files_with_complexity = []
-        for file_path, metrics in self.metrics.items():
-            if "cyclomatic_complexity" in metrics:
-                files_with_complexity.append((file_path, metrics["cyclomatic_complexity"]))
-        
-        return sorted(files_with_complexity, key=lambda x: x[1], reverse=True)[:limit]
+        return heapq.nlargest(limit, self._complexities.items(), key=lambda x: x[1])
     
     def to_dict(self) -> Dict[str, Dict[str, Any]]:
         """Convert metrics to a dictionary.
@@ -202,7 +396,8 @@ class CodeMetrics:
             CodeMetrics instance.
         """
         metrics = cls()
-        metrics.metrics = data
+        for file_path, file_metrics in data.items():
+            metrics.add_file_metrics(file_path, file_metrics)
         return metrics
 
 
@@ -218,6 +413,10 @@ class CodebaseAnalyzer:
         self.project_path = Path(project_path)
         self.dependency_graph = DependencyGraph()
         self.code_metrics = CodeMetrics()
+        
+        # Worker results keyed by file path, with the (mtime, size) they were
+        # computed for, so repeated analyses skip unchanged files
+        self._file_cache = {}  # type: Dict[str, Tuple[Tuple[int, int], Tuple[str, Any, Optional[str]]]]
     
     def analyze_codebase(self, include_patterns: List[str] = None, exclude_patterns: List[str] = None) -> Dict[str, Any]:
         """Analyze the codebase.
@@ -235,8 +434,7 @@ class CodebaseAnalyzer:
         files = self._find_files(include_patterns, exclude_patterns)
         
         # Analyze each file
-        for file_path in files:
-            self._analyze_file(file_path)
+        self._analyze_files(files)
         
         # Build dependency graph
         self._build_dependency_graph(files)
@@ -264,6 +462,14 @@ class CodebaseAnalyzer:
         include_patterns = include_patterns or ["**/*.py", "**/*.js", "**/*.jsx", "**/*.ts", "**/*.tsx"]
         exclude_patterns = exclude_patterns or ["**/node_modules/**", "**/__pycache__/**", "**/venv/**", "**/build/**", "**/dist/**"]
         
+        suffix_matches = [_SUFFIX_PATTERN_RE.fullmatch(pattern) for pattern in include_patterns]
+        dir_matches = [_DIR_PATTERN_RE.fullmatch(pattern) for pattern in exclude_patterns]
+        if all(suffix_matches) and all(dir_matches):
+            return self._walk_files(
+                [match.group(1) for match in suffix_matches],
+                {match.group(1) for match in dir_matches}
+            )
+        
         files = []
         for pattern in include_patterns:
             for file_path in self.project_path.glob(pattern):
@@ -276,99 +482,134 @@ class CodebaseAnalyzer:
                             break
                     
                     if not exclude:
-                        files.append(str(file_path.relative_to(self.project_path)))
+                        files.append(sys.intern(str(file_path.relative_to(self.project_path))))
         
         return files
     
-    def _analyze_file(self, file_path: str):
-        """Analyze a file.
+    def _walk_files(self, suffixes: List[str], exclude_dirs: Set[str]) -> List[str]:
+        """Find files by suffix in one walk of the project.
+        
+        Excluded directories are pruned rather than descended into. Files are
+        returned grouped by suffix in the order given, as separate glob
+        passes would return them.
         
         Args:
-            file_path: Path to the file to analyze.
+            suffixes: File name suffixes to include.
+            exclude_dirs: Names of directories to skip.
+            
+        Returns:
+            List of file paths relative to the project.
         """
-        full_path = os.path.join(self.project_path, file_path)
+        unique_suffixes = tuple(dict.fromkeys(suffixes))
+        found = {suffix: [] for suffix in unique_suffixes}
+        base = str(self.project_path)
+        
+        for root, dirs, names in os.walk(base):
+            dirs[:] = [d for d in dirs if d not in exclude_dirs]
+            rel_root = os.path.relpath(root, base)
+            for name in names:
+                if not name.endswith(unique_suffixes):
+                    continue
+                rel_path = sys.intern(name if rel_root == "." else os.path.join(rel_root, name))
+                if not os.path.isfile(os.path.join(root, name)):
+                    continue
+                for suffix in unique_suffixes:
+                    if name.endswith(suffix):
+                        found[suffix].append(rel_path)
         
-        try:
-            with open(full_path, 'r') as f:
-                content = f.read()
-            
-            # Determine file type
-            file_ext = os.path.splitext(file_path)[1].lower()
-            
-            if file_ext == '.py':
-                self._analyze_python_file(file_path, content)
-            elif file_ext in ['.js', '.jsx', '.ts', '.tsx']:
-                self._analyze_javascript_file(file_path, content)
-        except Exception as e:
-            console.print(f"[red]Error analyzing file {file_path}: {str(e)}[/red]")
+        files = []
+        for suffix in suffixes:
+            files.extend(found[suffix])
+        return files
     
-    def _analyze_python_file(self, file_path: str, content: str):
-        """Analyze a Python file.
+    def _analyze_files(self, files: List[str]):
+        """Analyze files, spreading large codebases across CPU cores.
+        
+        Files are parsed independently, in worker processes when there are
+        enough of them; results are merged here in the original file order.
+        Files unchanged since a previous analysis by this analyzer reuse
+        their earlier results.
         
         Args:
-            file_path: Path to the file to analyze.
-            content: Content of the file.
+            files: List of file paths.
         """
-        try:
-            tree = ast.parse(content)
-            
-            # Extract imports
-            imports = []
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for name in node.names:
-                        imports.append(name.name)
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        for name in node.names:
-                            imports.append(f"{node.module}.{name.name}")
-            
-            # Store imports in dependency graph
-            for imp in imports:
-                self.dependency_graph.add_edge(file_path, imp, {"type": "import"})
+        base = str(self.project_path)
+        plan = []  # (file path, stamp, cached outcome or None) per file
+        tasks = []
+        for file_path in files:
+            try:
+                stat = os.stat(os.path.join(base, file_path))
+                stamp = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                stamp = None
             
-            # Calculate cyclomatic complexity
-            complexity = self._calculate_python_complexity(tree)
+            cached = self._file_cache.get(file_path)
+            if stamp is not None and cached is not None and cached[0] == stamp:
+                plan.append((file_path, stamp, cached[1]))
+            else:
+                plan.append((file_path, stamp, None))
+                tasks.append((base, file_path))
+        
+        fresh = None
+        if len(tasks) >= _PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+            try:
+                with ProcessPoolExecutor() as executor:
+                    fresh = list(executor.map(_analyze_file_worker, tasks, chunksize=_PARALLEL_CHUNKSIZE))
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                # Process pools are unavailable on some restricted platforms,
+                # and workers can be killed, e.g. by the OOM killer
+                fresh = None
+        
+        if fresh is None:
+            fresh = map(_analyze_file_worker, tasks)
+        fresh = iter(fresh)
+        
+        for file_path, stamp, outcome in plan:
+            if outcome is None:
+                outcome = next(fresh)
+                if stamp is not None:
+                    self._file_cache[file_path] = (stamp, outcome)
             
-            # Store metrics
-            self.code_metrics.add_file_metrics(file_path, {
-                "lines_of_code": len(content.splitlines()),
-                "imports": imports,
-                "cyclomatic_complexity": complexity
-            })
-        except SyntaxError:
-            console.print(f"[yellow]Syntax error in {file_path}, skipping analysis[/yellow]")
-    
-    def _analyze_javascript_file(self, file_path: str, content: str):
-        """Analyze a JavaScript/TypeScript file.
+            _, result, message = outcome
+            if message:
+                console.print(message)
+            if result is not None:
+                self._record_file_analysis(file_path, *result)
+    
+    def _analyze_file(self, file_path: str):
+        """Analyze a file.
         
         Args:
             file_path: Path to the file to analyze.
-            content: Content of the file.
         """
-        # Extract imports using regex (simplified)
-        import_regex = r'import\s+(?:{[^}]*}|[^{}\n;]+)\s+from\s+[\'"]([^\'"]+)[\'"]'
-        require_regex = r'(?:const|let|var)\s+(?:{[^}]*}|[^{}\n;]+)\s+=\s+require\([\'"]([^\'"]+)[\'"]\)'
-        
-        imports = []
-        for match in re.finditer(import_regex, content):
-            imports.append(match.group(1))
+        _, result, message = _analyze_file_worker((str(self.project_path), file_path))
+        if message:
+            console.print(message)
+        if result is not None:
+            self._record_file_analysis(file_path, *result)
+    
+    def _record_file_analysis(self, file_path: str, imports: List[str], complexity: int, lines_of_code: int):
+        """Store the analysis of one file.
         
-        for match in re.finditer(require_regex, content):
-            imports.append(match.group(1))
+        Args:
+            file_path: Path to the analyzed file.
+            imports: Modules imported by the file.
+            complexity: Cyclomatic complexity of the file.
+            lines_of_code: Number of lines in the file.
+        """
+        # Results from worker processes arrive as fresh copies; intern the
+        # paths and module names so each is stored once and compared by
+        # identity in the graph and metrics dictionaries
+        file_path = sys.intern(file_path)
+        imports = [sys.intern(imp) for imp in imports]
         
         # Store imports in dependency graph
         for imp in imports:
             self.dependency_graph.add_edge(file_path, imp, {"type": "import"})
         
-        # Calculate cyclomatic complexity (simplified)
-        complexity = content.count('if ') + content.count('else ') + content.count('for ') + \
-                    content.count('while ') + content.count('switch ') + content.count('case ') + \
-                    content.count('&&') + content.count('||') + content.count('?') + 1
-        
         # Store metrics
         self.code_metrics.add_file_metrics(file_path, {
-            "lines_of_code": len(content.splitlines()),
+            "lines_of_code": lines_of_code,
             "imports": imports,
             "cyclomatic_complexity": complexity
         })
@@ -382,17 +623,7 @@ class CodebaseAnalyzer:
         Returns:
             Cyclomatic complexity.
         """
-        complexity = 1  # Base complexity
-        
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.While, ast.For)):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp) and isinstance(node.op, (ast.And, ast.Or)):
-                complexity += len(node.values) - 1
-            elif isinstance(node, ast.Try):
-                complexity += len(node.handlers)
-        
-        return complexity
+        return _scan_python_tree(tree)[1]
     
     def _build_dependency_graph(self, files: List[str]):
         """Build dependency graph for the codebase.
@@ -446,24 +677,30 @@ class CodebaseAnalyzer:
         """
         patterns = []
         
-        # Check for MVC pattern
-        has_models = any("model" in file.lower() for file in self.dependency_graph.nodes)
-        has_views = any("view" in file.lower() for file in self.dependency_graph.nodes)
-        has_controllers = any("controller" in file.lower() for file in self.dependency_graph.nodes)
+        # Find every keyword in one pass over the lowercased paths, stopping
+        # as soon as all of them have been seen. "repo" also covers
+        # "repository".
+        remaining = set(_ARCHITECTURE_KEYWORDS)
+        for file in self.dependency_graph.nodes:
+            name = file.lower()
+            found = [keyword for keyword in remaining if keyword in name]
+            if found:
+                remaining.difference_update(found)
+                if not remaining:
+                    break
         
-        if has_models and has_views and has_controllers:
+        seen = set(_ARCHITECTURE_KEYWORDS) - remaining
+        
+        # Check for MVC pattern
+        if "model" in seen and "view" in seen and "controller" in seen:
             patterns.append("Model-View-Controller (MVC)")
         
         # Check for Repository pattern
-        has_repositories = any("repository" in file.lower() or "repo" in file.lower() for file in self.dependency_graph.nodes)
-        
-        if has_repositories:
+        if "repo" in seen:
             patterns.append("Repository Pattern")
         
         # Check for Service pattern
-        has_services = any("service" in file.lower() for file in self.dependency_graph.nodes)
-        
-        if has_services:
+        if "service" in seen:
             patterns.append("Service Pattern")
         
         return patterns
@@ -489,11 +726,16 @@ class CodebaseAnalyzer:
                         "priority": "high" if complexity > 20 else "medium"
                     })
         
-        # Check for circular dependencies
-        for node in self.dependency_graph.nodes:
-            deps = self.dependency_graph.get_dependencies(node)
+        # Check for circular dependencies, reporting each pair once
+        nodes = self.dependency_graph.nodes
+        seen_pairs = set()
+        for node, deps in nodes.items():
             for dep in deps:
-                if dep in self.dependency_graph.nodes and node in self.dependency_graph.get_dependencies(dep):
+                if node in nodes.get(dep, ()):
+                    pair = frozenset((node, dep))
+                    if pair in seen_pairs:
+                        continue
+                    seen_pairs.add(pair)
                     suggestions.append({
                         "type": "circular_dependency",
                         "files": [node, dep],
@@ -511,11 +753,15 @@ class CodebaseAnalyzer:
         """
         return self.dependency_graph.visualize()
     
-    def export_analysis(self, output_path: str) -> bool:
+    def export_analysis(self, output_path: str, indent: Optional[int] = None) -> bool:
         """Export analysis results to a file.
         
+        The JSON is written compactly unless an indent is given, and is
+        gzip-compressed when the path ends with ".gz".
+        
         Args:
             output_path: Path to save the analysis results.
+            indent: Optional indentation for human-readable output.
             
         Returns:
             Whether the export was successful.
@@ -527,8 +773,13 @@ class CodebaseAnalyzer:
                 "summary": self._generate_summary()
             }
             
-            with open(output_path, 'w') as f:
-                json.dump(analysis, f, indent=2)
+            separators = (',', ':') if indent is None else None
+            if output_path.endswith('.gz'):
+                f = gzip.open(output_path, 'wt', encoding='utf-8')
+            else:
+                f = open(output_path, 'w')
+            with f:
+                json.dump(analysis, f, indent=indent, separators=separators)
             
             console.print(f"[green]Analysis exported to {output_path}[/green]")
             return True
@@ -539,6 +790,8 @@ class CodebaseAnalyzer:
     def import_analysis(self, input_path: str) -> bool:
         """Import analysis results from a file.
         
+        Both plain and gzip-compressed exports are accepted.
+        
         Args:
             input_path: Path to the analysis file.
             
@@ -546,8 +799,11 @@ class CodebaseAnalyzer:
             Whether the import was successful.
         """
         try:
-            with open(input_path, 'r') as f:
-                analysis = json.load(f)
+            with open(input_path, 'rb') as f:
+                data = f.read()
+            if data[:2] == b'\x1f\x8b':
+                data = gzip.decompress(data)
+            analysis = json.loads(data)
             
             self.dependency_graph = DependencyGraph.from_dict(analysis.get("dependency_graph", {}))
             self.code_metrics = CodeMetrics.from_dict(analysis.get("code_metrics", {}))
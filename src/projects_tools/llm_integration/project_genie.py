@@ -26,17 +26,19 @@ console = Console()
 class ProjectGenie:
     """Main class for LLM-assisted project generation."""
     
-    def __init__(self, project_path: str, llm_provider: str = "openai"):
+    def __init__(self, project_path: str, llm_provider: str = "openai", use_cache: bool = False):
         """Initialize Project Genie.
         
         Args:
             project_path: Path to the project directory.
             llm_provider: LLM provider to use. One of "openai" or "anthropic".
+            use_cache: Whether code generation reuses cached responses to
+                identical prompts; see CodeGenerator.
         """
         self.project_path = Path(project_path)
         self.llm_client = get_llm_client(llm_provider)
         self.project_context = ProjectContext(project_path)
-        self.code_generator = CodeGenerator(self.llm_client, self.project_context)
+        self.code_generator = CodeGenerator(self.llm_client, self.project_context, use_cache)
         self.code_validator = CodeValidator(project_path)
         self.runtime_validator = RuntimeValidator(project_path)
         self.db_schema_generator = DBSchemaGenerator(self.llm_client, self.project_context)
@@ -395,16 +397,17 @@ Return only the fixed code without any explanations or markdown formatting.
         tree = self.codebase_analyzer.visualize_dependency_graph()
         console.print(tree)
     
-    def export_analysis(self, output_path: str) -> bool:
+    def export_analysis(self, output_path: str, indent: Optional[int] = None) -> bool:
         """Export analysis results to a file.
         
         Args:
             output_path: Path to save the analysis results.
+            indent: Optional indentation for human-readable output.
             
         Returns:
             Whether the export was successful.
         """
-        return self.codebase_analyzer.export_analysis(output_path)
+        return self.codebase_analyzer.export_analysis(output_path, indent)
     
     def add_feedback(self, component_path: str, feedback_type: str, feedback_message: str) -> str:
         """Add feedback for a component.
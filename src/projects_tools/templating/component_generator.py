@@ -8,7 +8,7 @@ from templates with advanced features like inheritance and variable substitution
 import os
 import logging
 import json
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, IO
 from pathlib import Path
 
 from .template_manager import TemplateManager
@@ -82,27 +82,40 @@ class ComponentGenerator:
         Args:
             registry_file: Path to registry file
         """
-        if os.path.exists(registry_file):
-            with open(registry_file, 'r') as f:
-                registry = json.load(f)
+        try:
+            f = open(registry_file, 'rb')
+        except FileNotFoundError:
+            return
+        
+        with f:
+            self.load_component_registry_from_stream(f)
+    
+    def load_component_registry_from_stream(self, stream: IO):
+        """
+        Load component registry from an open file.
+        
+        Args:
+            stream: Text or binary file object containing the registry JSON
+        """
+        registry = json.load(stream)
+        
+        if 'components' in registry:
+            for name, config in registry['components'].items():
+                self.register_component(
+                    name,
+                    config.get('template_files', {}),
+                    config.get('base_component'),
+                    config.get('description')
+                )
                 
-                if 'components' in registry:
-                    for name, config in registry['components'].items():
-                        self.register_component(
-                            name,
-                            config.get('template_files', {}),
-                            config.get('base_component'),
-                            config.get('description')
-                        )
-                        
-                if 'base_components' in registry:
-                    for name, config in registry['base_components'].items():
-                        self.register_base_component(
-                            name,
-                            config.get('template_files', {}),
-                            config.get('description'),
-                            config.get('required_vars')
-                        )
+        if 'base_components' in registry:
+            for name, config in registry['base_components'].items():
+                self.register_base_component(
+                    name,
+                    config.get('template_files', {}),
+                    config.get('description'),
+                    config.get('required_vars')
+                )
                         
     def save_component_registry(self, registry_file: str):
         """
@@ -292,7 +305,7 @@ class ComponentGenerator:
             full_output_path = os.path.join(output_dir, resolved_path)
             
             # Render template to file
-            self.template_manager.render_to_file(template_name, full_output_path, context)
+            self.template_manager.stream_to_file(template_name, full_output_path, context)
             
             generated_files.append(full_output_path)
             
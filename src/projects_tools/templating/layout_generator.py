@@ -8,7 +8,7 @@ templates with advanced features like inheritance and variable substitution.
 import os
 import logging
 import json
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Union, Tuple, IO
 from pathlib import Path
 
 from .template_manager import TemplateManager
@@ -68,12 +68,23 @@ class LayoutGenerator:
         Args:
             layout_file: Path to layout file
         """
-        if not os.path.exists(layout_file):
+        try:
+            f = open(layout_file, 'rb')
+        except FileNotFoundError:
             logger.warning(f"Layout file not found: {layout_file}")
             return
         
-        with open(layout_file, 'r') as f:
-            layouts = json.load(f)
+        with f:
+            self.load_layouts_from_stream(f)
+    
+    def load_layouts_from_stream(self, stream: IO):
+        """
+        Load layouts from an open file.
+        
+        Args:
+            stream: Text or binary file object containing the layout JSON
+        """
+        layouts = json.load(stream)
             
         for layout_id, layout_info in layouts.items():
             self.register_layout(
@@ -84,6 +84,24 @@ class TemplateContext:
         """
         self.context.update(values)
         
+    def extend(self, values: Dict[str, Any]) -> 'TemplateContext':
+        """
+        Create a new context with additional values.
+        
+        The new context starts from a shallow copy of this context's
+        variables, parents and filters; this context is left unchanged.
+        
+        Args:
+            values: Dictionary of values to add or override
+            
+        Returns:
+            The extended context
+        """
+        extended = TemplateContext({**self.context, **values})
+        extended.parent_contexts = list(self.parent_contexts)
+        extended._filters = dict(self._filters)
+        return extended
+        
     def inherit_from(self, parent_context: 'TemplateContext'):
         """
         Inherit from a parent context.
@@ -11,6 +11,7 @@ import logging
 from typing import Dict, Any, Optional, List, Union, Callable
 from pathlib import Path
 from jinja2 import Environment, PackageLoader, FileSystemLoader, select_autoescape, Template, ChoiceLoader
+from jinja2 import BytecodeCache
 
 from .template_context import TemplateContext
 
@@ -29,7 +30,8 @@ class TemplateManager:
     def __init__(self, 
                  package_name: str = 'projects_tools', 
                  template_dir: str = 'templates',
-                 custom_template_dirs: Optional[List[str]] = None):
+                 custom_template_dirs: Optional[List[str]] = None,
+                 bytecode_cache: Optional[BytecodeCache] = None):
         """
         Initialize a new template manager.
         
@@ -37,6 +39,8 @@ class TemplateManager:
             package_name: Package name for PackageLoader
             template_dir: Template directory within package
             custom_template_dirs: Optional list of custom template directories
+            bytecode_cache: Optional Jinja2 bytecode cache so compiled
+                templates can be reused across processes
         """
         self.package_name = package_name
         self.template_dir = template_dir
@@ -53,12 +57,15 @@ class TemplateManager:
         # Add package loader
         loaders.append(PackageLoader(self.package_name, self.template_dir))
         
-        # Create environment with choice loader
+        # Create environment with choice loader. Templates are memoized in
+        # template_cache below, so Jinja's own up-to-date checks are skipped.
         self.env = Environment(
             loader=ChoiceLoader(loaders),
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            auto_reload=False,
+            bytecode_cache=bytecode_cache
         )
         
         # Template cache
@@ -199,6 +206,41 @@ class TemplateManager:
             
         return output_file
     
+    def stream_to_file(self, template_name: str, output_file: str,
+                       context: Union[Dict[str, Any], TemplateContext],
+                       create_dirs: bool = True) -> str:
+        """
+        Render a template to a file, writing output as it is generated.
+        
+        Unlike render_to_file, the rendered template is never held in memory
+        as a single string.
+        
+        Args:
+            template_name: Name of the template
+            output_file: Path to output file
+            context: Template context (dict or TemplateContext)
+            create_dirs: Whether to create parent directories
+            
+        Returns:
+            Path to the created file
+        """
+        # Create parent directories if needed
+        if create_dirs:
+            os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+            
+        template = self.get_template(template_name)
+        
+        if isinstance(context, TemplateContext):
+            # Apply any custom filters from the context
+            context.apply_filters_to_env(self.env)
+            stream = template.stream(**context.get_merged_context())
+        else:
+            stream = template.stream(**context)
+            
+        stream.dump(output_file, encoding='utf-8')
+        
+        return output_file
+    
     def list_templates(self, pattern: Optional[str] = None) -> List[str]:
         """
         List available templates.
@@ -8,7 +8,7 @@ algorithmic generation patterns for highly accurate templated content.
 import os
 import json
 import logging
-from typing import Dict, Any, Optional, List, Union, Callable
+from typing import Dict, Any, Optional, List, Union, Callable, IO
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -35,8 +35,14 @@ class TemplateRegistry:
         self.algorithms = {}
         self.metadata = {}
         
-        if registry_file and os.path.exists(registry_file):
-            self.load_from_file(registry_file)
+        if registry_file:
+            try:
+                f = open(registry_file, 'rb')
+            except FileNotFoundError:
+                pass
+            else:
+                with f:
+                    self.load_from_stream(f)
     
     def register_template(self, 
                          template_id: str, 
@@ -291,12 +297,23 @@ class TemplateRegistry:
         Args:
             registry_file: Path to load the registry from
         """
-        if not os.path.exists(registry_file):
+        try:
+            f = open(registry_file, 'rb')
+        except FileNotFoundError:
             logger.warning(f"Registry file not found: {registry_file}")
             return
         
-        with open(registry_file, 'r') as f:
-            registry_data = json.load(f)
+        with f:
+            self.load_from_stream(f)
+    
+    def load_from_stream(self, stream: IO):
+        """
+        Load the registry from an open file.
+        
+        Args:
+            stream: Text or binary file object containing the registry JSON
+        """
+        registry_data = json.load(stream)
         
         # Load templates
         for template_id, info in registry_data.get('templates', {}).items():
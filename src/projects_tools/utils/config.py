@@ -13,6 +13,9 @@ from typing import Any, Dict, Optional, Union, cast
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for keys missing from the configuration
+_MISSING = object()
+
 # Default configuration values
 DEFAULT_CONFIG = {
     # LLM settings
@@ -63,6 +66,7 @@ class Config:
         self._config_file_path: Optional[Path] = None
         self._loaded_from_file = False
         self._loaded_from_env = False
+        self._cache: Dict[str, Any] = {}
 
     def load_from_file(self, file_path: Optional[Union[str, Path]] = None) -> bool:
         """
@@ -142,6 +146,9 @@ class Config:
                 self._set_nested_value(self._config, parts, typed_value)
                 loaded = True
 
+        if loaded:
+            self._invalidate_cache()
+
         self._loaded_from_env = loaded
         if loaded:
             logger.info("Loaded configuration from environment variables")
@@ -178,6 +185,27 @@ class Config:
 
         return value
 
+    def get_cached(self, key: str, default: Any = None) -> Any:
+        """
+        Get a configuration value, memoizing the lookup.
+
+        The cache is cleared whenever the configuration is modified through
+        this class.
+
+        Args:
+            key: Configuration key, using dot notation for nested values.
+            default: Default value to return if key is not found.
+
+        Returns:
+            Configuration value or default.
+        """
+        try:
+            value = self._cache[key]
+        except KeyError:
+            value = self._cache[key] = self.get(key, _MISSING)
+
+        return default if value is _MISSING else value
+
     def set(self, key: str, value: Any) -> None:
         """
         Set a configuration value.
@@ -188,6 +216,7 @@ class Config:
         """
         parts = key.split(".")
         self._set_nested_value(self._config, parts, value)
+        self._invalidate_cache()
 
     def _update_config(self, config_dict: Dict[str, Any]) -> None:
         """
@@ -209,6 +238,11 @@ class Config:
                     target[key] = value
 
         update_nested(self._config, config_dict)
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        """Drop memoized lookups."""
+        self._cache.clear()
 
     def _set_nested_value(
         self, config_dict: Dict[str, Any], keys: list, value: Any
@@ -269,7 +303,7 @@ class Config:
         Get the configuration as a dictionary.
 
         Returns:
-            Configuration dictionary.
+            A copy of the configuration dictionary.
         """
         return self._config.copy()
 
@@ -12,11 +12,9 @@ console = Console()
 def create_vue_project(project_name, project_path):
     """Create Vue project with Vite"""
     try:
-        # Render and write Makefile
+        # Render the Makefile straight into the file
         makefile_template = env.get_template('Makefile.jinja2')
-        makefile_content = makefile_template.render(project_name=project_name, python_package_name=project_name.replace('-', '_'))
-        with open(project_path / "Makefile", "w") as f:
-            f.write(makefile_content)
+        makefile_template.stream(project_name=project_name, python_package_name=project_name.replace('-', '_')).dump(str(project_path / "Makefile"))
 
         console.print(f"\n[bold yellow]Executing make vue (this may take a few minutes)...[/bold yellow]")
         process = subprocess.Popen(
@@ -0,0 +1,70 @@
+"""
+Tests for the CLI validators module.
+"""
+
+import os
+import sys
+
+import pytest
+
+from projects_tools.cli.validators import (
+    validate_component_path,
+    validate_project_name,
+    validate_project_path,
+)
+from projects_tools.utils.errors import ValidationError
+
+
+def test_validate_project_path(tmp_path):
+    """Test validating a project directory."""
+    assert validate_project_path(str(tmp_path)) == tmp_path
+
+    with pytest.raises(ValidationError, match="does not exist"):
+        validate_project_path(str(tmp_path / "missing"))
+
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("content")
+    with pytest.raises(ValidationError, match="is not a directory"):
+        validate_project_path(str(file_path))
+
+
+def test_validate_component_path(tmp_path):
+    """Test validating a component file, absolute or relative to a project."""
+    (tmp_path / "src").mkdir()
+    component = tmp_path / "src" / "component.py"
+    component.write_text("x = 1\n")
+
+    assert validate_component_path(str(component)) == str(component)
+    assert validate_component_path("src/component.py", str(tmp_path)) == "src/component.py"
+
+    with pytest.raises(ValidationError, match="does not exist"):
+        validate_component_path("src/missing.py", str(tmp_path))
+
+    with pytest.raises(ValidationError, match="is not a file"):
+        validate_component_path("src", str(tmp_path))
+
+
+def test_validate_project_name(tmp_path, monkeypatch):
+    """Test validating a new project name."""
+    monkeypatch.chdir(tmp_path)
+    assert validate_project_name("my-project_1") == "my-project_1"
+
+    with pytest.raises(ValidationError, match="cannot be empty"):
+        validate_project_name("")
+
+    with pytest.raises(ValidationError, match="can only contain"):
+        validate_project_name("my project")
+
+    (tmp_path / "taken").mkdir()
+    with pytest.raises(ValidationError, match="already exists"):
+        validate_project_name("taken")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need extra privileges on Windows")
+def test_validate_project_name_dangling_symlink(tmp_path, monkeypatch):
+    """Test that a dangling symlink counts as an existing project name."""
+    monkeypatch.chdir(tmp_path)
+    os.symlink(tmp_path / "missing", "dangling")
+
+    with pytest.raises(ValidationError, match="already exists"):
+        validate_project_name("dangling")
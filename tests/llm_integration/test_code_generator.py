@@ -0,0 +1,120 @@
+"""
+Tests for the code generator module.
+"""
+
+import pytest
+
+pytest.importorskip("requests")
+
+from projects_tools.llm_integration.code_generator import _CODE_BLOCK_RE, CodeGenerator
+from projects_tools.llm_integration.context_manager import ProjectContext
+
+
+class FakeClient:
+    """LLM client stand-in that counts generate calls."""
+
+    model = "fake-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, prompt):
+        self.calls += 1
+        return f"response {self.calls}"
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    """Point the response cache at a temporary directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """Return a generator that never uses its client."""
+    return CodeGenerator(FakeClient(), ProjectContext(str(tmp_path)))
+
+
+def test_generate_reuses_cached_response(tmp_path, cache_home):
+    """Test that a repeated prompt is answered from the cache."""
+    client = FakeClient()
+    generator = CodeGenerator(client, ProjectContext(str(tmp_path)), use_cache=True)
+
+    assert generator._generate("prompt") == "response 1"
+    assert generator._generate("prompt") == "response 1"
+    assert client.calls == 1
+
+    # A new generator reads the same response back from disk
+    generator = CodeGenerator(client, ProjectContext(str(tmp_path)), use_cache=True)
+    assert generator._generate("prompt") == "response 1"
+    assert client.calls == 1
+    assert (cache_home / "projects_tools").is_dir()
+
+    assert generator._generate("other prompt") == "response 2"
+    assert client.calls == 2
+
+
+def test_generate_without_cache(tmp_path, cache_home):
+    """Test that the cache is off by default."""
+    client = FakeClient()
+    generator = CodeGenerator(client, ProjectContext(str(tmp_path)))
+
+    assert generator._generate("prompt") == "response 1"
+    assert generator._generate("prompt") == "response 2"
+    assert client.calls == 2
+    assert not cache_home.exists()
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        # Language-tagged fence
+        ("Here you go:\n```python\nprint(1)\n```\nDone.", "print(1)"),
+        # Untagged fence
+        ("```\nx = 1\ny = 2\n```", "x = 1\ny = 2"),
+        # Unterminated fence returns the whole response
+        ("```python\nprint(1)\n", "```python\nprint(1)"),
+        # An empty block falls back to the pattern, which matches across it
+        ("```\n```\ntext\n```js\nx = 1\n```", "```\ntext"),
+        # No fence returns the whole response
+        ("  plain answer  ", "plain answer"),
+    ],
+)
+def test_extract_code_from_response(generator, response, expected):
+    """Test that code extraction matches the code block pattern."""
+    matches = _CODE_BLOCK_RE.findall(response)
+    assert (matches[0].strip() if matches else response.strip()) == expected
+    assert generator._extract_code_from_response(response) == expected
+
+
+def test_extract_json_array(generator):
+    """Test extracting a clean JSON array of objects."""
+    response = '[{"name": "a", "type": "backend"}, {"name": "b"}]'
+    assert generator._extract_json_array(response) == [
+        {"name": "a", "type": "backend"},
+        {"name": "b"},
+    ]
+
+
+def test_extract_json_array_trailing_prose(generator):
+    """Test that trailing prose after the array does not prevent parsing."""
+    response = 'Components:\n[\n  {"name": "a"}\n]\nNote that a list like [{x}] always ends in }].'
+    assert generator._extract_json_array(response) == [{"name": "a"}]
+
+
+def test_extract_json_array_unclosed(generator):
+    """Test that many unclosed array openers fail quickly."""
+    response = "[{" * 100000
+    with pytest.raises(ValueError):
+        generator._extract_json_array(response)
+
+    response = "[{ " * 100000 + "]"
+    with pytest.raises(ValueError):
+        generator._extract_json_array(response)
+
+
+def test_extract_json_array_missing(generator):
+    """Test that a response without an array is rejected."""
+    with pytest.raises(ValueError):
+        generator._extract_json_array("I could not find any components.")
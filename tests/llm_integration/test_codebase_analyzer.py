@@ -0,0 +1,273 @@
+"""
+Tests for the codebase analyzer module.
+"""
+
+import ast
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from projects_tools.llm_integration import codebase_analyzer
+from projects_tools.llm_integration.codebase_analyzer import (
+    CodebaseAnalyzer,
+    CodeMetrics,
+    DependencyGraph,
+)
+
+PYTHON_SNIPPET = """\
+import os
+from pkg import a, b
+
+
+def f(x, y, z):
+    import json
+    if x and y or z:
+        pass
+    elif y:
+        pass
+    while x:
+        for i in x:
+            pass
+    try:
+        from .rel import c
+        from . import d
+    except ValueError:
+        pass
+    except KeyError:
+        pass
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a small project with Python and JavaScript files."""
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    for i in range(6):
+        (pkg / f"mod{i}.py").write_text(
+            f"import os\nfrom pkg import mod{(i + 1) % 6}\n\n"
+            f"def f(x):\n    if x > {i}:\n        return x\n    return 0\n"
+        )
+    (pkg / "broken.py").write_text("def f(:\n")
+    (tmp_path / "app.js").write_text(
+        "import React from 'react';\nconst x = require('./util');\nif (a && b) { x(); }\n"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def parallel(monkeypatch):
+    """Send every analysis through the process pool."""
+    monkeypatch.setattr(codebase_analyzer, "_PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr(codebase_analyzer.os, "cpu_count", lambda: 2)
+
+
+def test_parallel_matches_serial(project, parallel):
+    """Test that analyzing in worker processes gives the serial result."""
+    result = CodebaseAnalyzer(str(project)).analyze_codebase()
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(codebase_analyzer, "_PARALLEL_MIN_FILES", 10**6)
+        expected = CodebaseAnalyzer(str(project)).analyze_codebase()
+
+    assert result == expected
+    assert len(expected["code_metrics"]) == 8
+
+
+def test_broken_pool_falls_back_to_serial(project, parallel, monkeypatch):
+    """Test that a broken process pool falls back to serial analysis."""
+    expected = CodebaseAnalyzer(str(project)).analyze_codebase()
+
+    class BrokenExecutor:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, *args, **kwargs):
+            raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(codebase_analyzer, "ProcessPoolExecutor", BrokenExecutor)
+    assert CodebaseAnalyzer(str(project)).analyze_codebase() == expected
+
+
+def test_code_metrics_round_trip():
+    """Test that metrics restored from a dictionary answer the same queries."""
+    metrics = CodeMetrics()
+    metrics.add_file_metrics("a.py", {"cyclomatic_complexity": 3, "lines_of_code": 10})
+    metrics.add_file_metrics("b.py", {"cyclomatic_complexity": 7, "lines_of_code": 20})
+    metrics.add_file_metrics("__project__", {"total_files": 2})
+
+    restored = CodeMetrics.from_dict(metrics.to_dict())
+    assert restored.to_dict() == metrics.to_dict()
+    assert restored.get_average_complexity() == 5.0
+    assert restored.get_highest_complexity_files(1) == [("b.py", 7)]
+
+
+def test_parse_python():
+    """Test the imports and complexity found in Python source."""
+    imports, complexity = codebase_analyzer._parse_python(PYTHON_SNIPPET)
+
+    # Imports are listed breadth first; relative imports without a module are skipped
+    assert imports == ["os", "pkg.a", "pkg.b", "json", "rel.c"]
+    # 1 + if/elif + and/or + while + for + two except handlers
+    assert complexity == 9
+
+    analyzer = CodebaseAnalyzer(".")
+    assert analyzer._calculate_python_complexity(ast.parse(PYTHON_SNIPPET)) == 9
+
+
+def test_dependency_graph_round_trip():
+    """Test that a graph restored from a dictionary keeps nodes and edge metadata."""
+    graph = DependencyGraph()
+    graph.add_node("a.py", {"kind": "module"})
+    graph.add_edge("a.py", "b.py", {"type": "import"})
+    graph.add_edge("c.py", "b.py")
+
+    data = graph.to_dict()
+    assert set(data) == {"nodes", "metadata", "edges"}
+    assert data["metadata"] == {"a.py": {"kind": "module"}, "b.py": {}, "c.py": {}}
+
+    restored = DependencyGraph.from_dict(data)
+    assert restored.nodes == graph.nodes
+    assert restored.metadata == graph.metadata
+    assert restored.get_dependents("b.py") == {"a.py", "c.py"}
+    assert restored.get_edge_metadata("a.py", "b.py") == {"type": "import"}
+    assert restored.get_edge_metadata("b.py", "a.py") == {}
+
+
+def test_dependency_graph_from_legacy_dict():
+    """Test loading an export that kept edge metadata under "<from>_<to>" keys."""
+    data = {
+        "nodes": {"a.py": ["b.py"], "b.py": [], "c.py": ["b.py"]},
+        "metadata": {
+            "a.py": {"kind": "module"},
+            "b.py": {},
+            "c.py": {},
+            "a.py_b.py": {"type": "import"},
+            "c.py_b.py": {},
+        },
+    }
+
+    graph = DependencyGraph.from_dict(data)
+    assert graph.metadata == {"a.py": {"kind": "module"}, "b.py": {}, "c.py": {}}
+    assert graph.get_edge_metadata("a.py", "b.py") == {"type": "import"}
+    assert graph.get_edge_metadata("c.py", "b.py") == {}
+    assert graph.get_dependents("b.py") == {"a.py", "c.py"}
+    assert "a.py_b.py" in data["metadata"]
+
+
+@pytest.mark.parametrize(
+    "name, indent",
+    [("analysis.json", None), ("analysis.json", 2), ("analysis.json.gz", None)],
+)
+def test_export_import_round_trip(project, tmp_path, name, indent):
+    """Test that an exported analysis imports back with the same graph and metrics."""
+    analyzer = CodebaseAnalyzer(str(project))
+    analyzer.analyze_codebase()
+    analyzer.dependency_graph.add_edge("pkg/mod0.py", "pkg/mod1.py", {"type": "import"})
+
+    output_path = str(tmp_path / name)
+    assert analyzer.export_analysis(output_path, indent=indent)
+    with open(output_path, "rb") as f:
+        data = f.read()
+    assert data.startswith(b"\x1f\x8b") == name.endswith(".gz")
+    if not name.endswith(".gz"):
+        assert (b"\n" in data) == (indent is not None)
+
+    restored = CodebaseAnalyzer(str(project))
+    assert restored.import_analysis(output_path)
+    assert restored.dependency_graph.nodes == analyzer.dependency_graph.nodes
+    assert restored.dependency_graph.metadata == analyzer.dependency_graph.metadata
+    assert restored.dependency_graph.edges == analyzer.dependency_graph.edges
+    assert restored.code_metrics.to_dict() == analyzer.code_metrics.to_dict()
+    assert (
+        restored.code_metrics.get_average_complexity()
+        == analyzer.code_metrics.get_average_complexity()
+    )
+
+
+def make_tree(root, rel_paths):
+    """Create small files at the given paths below root."""
+    for rel_path in rel_paths:
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+
+
+def native(rel_paths):
+    """Return sorted relative paths with the platform separator."""
+    return sorted(os.path.join(*rel_path.split("/")) for rel_path in rel_paths)
+
+
+def test_find_files_prunes_excluded_dirs(tmp_path):
+    """Test that the single-walk path prunes excluded directories at any depth."""
+    make_tree(
+        tmp_path,
+        [
+            "main.py",
+            "pkg/mod.py",
+            "pkg/.hidden/secret.py",
+            ".config/settings.js",
+            "web/app.tsx",
+            "web/util.ts",
+            "notes.txt",
+            "node_modules/left-pad/index.js",
+            "node_modules/left-pad/lib/pad.js",
+            "web/node_modules/react/index.js",
+            "pkg/__pycache__/mod.py",
+            "pkg/venv/lib/site.py",
+        ],
+    )
+    files = CodebaseAnalyzer(str(tmp_path))._find_files()
+
+    # Hidden directories are searched; excluded ones are skipped at any depth
+    assert sorted(files) == native(
+        [
+            "main.py",
+            "pkg/mod.py",
+            "pkg/.hidden/secret.py",
+            ".config/settings.js",
+            "web/util.ts",
+            "web/app.tsx",
+        ]
+    )
+    # Files are grouped by include pattern, as separate glob passes return them
+    assert [os.path.splitext(f)[1] for f in files] == [".py", ".py", ".py", ".js", ".ts", ".tsx"]
+
+
+def test_find_files_glob_fallback(tmp_path, monkeypatch):
+    """Test that the glob fallback finds the same files as the single walk."""
+    # Path.match only excludes files directly inside an excluded directory
+    # below the root, so the trees agree on that layout
+    make_tree(
+        tmp_path,
+        [
+            "main.py",
+            "pkg/mod.py",
+            "pkg/.hidden/secret.py",
+            "pkg/__pycache__/mod.py",
+            "web/util.ts",
+            "web/node_modules/types.ts",
+            "notes.txt",
+        ],
+    )
+    analyzer = CodebaseAnalyzer(str(tmp_path))
+    include = ["**/*.py", "**/*.ts"]
+    expected = native(["main.py", "pkg/mod.py", "pkg/.hidden/secret.py", "web/util.ts"])
+
+    walked = analyzer._find_files(include, ["**/__pycache__/**", "**/node_modules/**"])
+    assert sorted(walked) == expected
+
+    # A pattern outside the simple "**/<dir>/**" shape forces the glob path
+    monkeypatch.setattr(analyzer, "_walk_files", None)
+    globbed = analyzer._find_files(
+        include, ["**/__pycache__/**", "**/node_modules/**", "**/*.min.js"]
+    )
+    assert sorted(globbed) == expected
+    assert [os.path.splitext(f)[1] for f in globbed] == [os.path.splitext(f)[1] for f in walked]
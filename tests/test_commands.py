@@ -0,0 +1,69 @@
+"""
+Tests for the top-level command helpers.
+"""
+
+import os
+import stat
+import sys
+
+import pytest
+
+from projects_tools.commands import _escape, _write_files, _write_small, say
+
+
+def test_write_small(tmp_path):
+    """Test writing, overwriting and appending bytes."""
+    path = str(tmp_path / "file.txt")
+
+    _write_small(path, b"hello\n")
+    _write_small(path, b"world\n")
+    assert open(path, "rb").read() == b"world\n"
+
+    _write_small(path, b"again\n", append=True)
+    assert open(path, "rb").read() == b"world\nagain\n"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+def test_write_small_mode(tmp_path):
+    """Test that mode is applied exactly, regardless of umask or an existing file."""
+    path = str(tmp_path / "deploy.sh")
+
+    old_umask = os.umask(0o077)
+    try:
+        _write_small(path, b"#!/bin/sh\n", mode=0o755)
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o755
+
+        # An existing file keeps its mode on open, so it must be reset
+        os.chmod(path, 0o600)
+        _write_small(path, b"#!/bin/sh\n", mode=0o755)
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o755
+    finally:
+        os.umask(old_umask)
+    assert open(path, "rb").read() == b"#!/bin/sh\n"
+
+
+def test_write_files_durable(tmp_path, monkeypatch):
+    """Test that durable writes fsync every file and their directory."""
+    synced = []
+    real_fsync = os.fsync
+
+    def fsync(fd):
+        synced.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fsync)
+    files = [(str(tmp_path / f"file{i}.txt"), b"data") for i in range(3)]
+
+    _write_files(files)
+    assert synced == []
+
+    _write_files(files, durable=True)
+    expected = len(files) + (0 if sys.platform == "win32" else 1)
+    assert len(synced) == expected
+    assert all(open(path, "rb").read() == b"data" for path, _ in files)
+
+
+def test_say_plain(capsys):
+    """Test that say strips markup but keeps user text when not on a terminal."""
+    say(f"[bold green]Created {_escape('[demo] app')}[/bold green]", panel=True)
+    assert capsys.readouterr().out == "Created [demo] app\n"
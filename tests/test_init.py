@@ -0,0 +1,39 @@
+"""
+Tests for the package entry point.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import projects_tools
+
+
+def _modules_after(statement):
+    """Run ``statement`` in a fresh interpreter and return its loaded modules."""
+    src_dir = os.path.dirname(os.path.dirname(projects_tools.__file__))
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+    code = f"import json, sys; {statement}; print(json.dumps(sorted(sys.modules)))"
+    output = subprocess.check_output([sys.executable, "-c", code], env=env)
+    return set(json.loads(output))
+
+
+def test_import_is_lightweight():
+    """Test that importing the package does not load the CLI stack."""
+    modules = _modules_after("import projects_tools")
+    assert "click" not in modules
+    assert "rich" not in modules
+    assert "projects_tools.cli.commands" not in modules
+
+
+def test_version_is_eager():
+    """Test that __version__ is available without touching lazy exports."""
+    assert projects_tools.__version__
+
+
+def test_cli_is_resolved_lazily():
+    """Test that cli and main resolve on first attribute access."""
+    modules = _modules_after("import projects_tools; projects_tools.main")
+    assert "projects_tools.cli.commands" in modules
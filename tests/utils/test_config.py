@@ -163,3 +163,36 @@ def test_config_as_dict(fresh_config):
     assert "test" in config_dict
     assert "key" in config_dict["test"]
     assert config_dict["test"]["key"] == "value"
+
+
+def test_config_get_cached(fresh_config):
+    """Test that cached lookups are invalidated when the configuration changes."""
+    config = fresh_config
+
+    # Test cached lookups return the same values as get
+    assert config.get_cached("llm.default_provider") == "openai"
+    assert config.get_cached("non_existent_key", "default") == "default"
+
+    # Test that set invalidates the cache
+    config.set("llm.default_provider", "anthropic")
+    assert config.get_cached("llm.default_provider") == "anthropic"
+
+    # Test that update_from_dict invalidates the cache
+    config.update_from_dict({"non_existent_key": "value"})
+    assert config.get_cached("non_existent_key", "default") == "value"
+
+
+def test_config_as_dict_copy(fresh_config):
+    """Test that mutating the as_dict result does not change the configuration."""
+    config = fresh_config
+
+    # Test that removing a key from the result does not leak into later calls
+    config_dict = config.as_dict()
+    config_dict.pop("llm")
+    config_dict["extra"] = "value"
+    assert "llm" in config.as_dict()
+    assert "extra" not in config.as_dict()
+
+    # Test that set is reflected in later calls
+    config.set("test.key", "value")
+    assert config.as_dict()["test"]["key"] == "value"